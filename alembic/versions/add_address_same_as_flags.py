@@ -0,0 +1,57 @@
+"""add address same-as flags
+
+Revision ID: address_same_as_001
+Revises: token_hash_bytea_001
+Create Date: 2025-12-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'address_same_as_001'
+down_revision = 'token_hash_bytea_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'rc_data',
+        sa.Column('present_same_as_permanent', sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+    op.add_column(
+        'licence_data',
+        sa.Column('bio_temp_same_as_perm', sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+    # Stop storing second copies of addresses that match the primary one
+    op.execute("""
+        UPDATE rc_data
+        SET present_same_as_permanent = TRUE, present_address = NULL
+        WHERE present_address IS NOT NULL AND present_address = permanent_address
+    """)
+    op.execute("""
+        UPDATE licence_data
+        SET bio_temp_same_as_perm = TRUE,
+            bio_temp_add1 = NULL, bio_temp_add2 = NULL, bio_temp_add3 = NULL
+        WHERE bio_temp_add1 IS NOT DISTINCT FROM bio_perm_add1
+          AND bio_temp_add2 IS NOT DISTINCT FROM bio_perm_add2
+          AND bio_temp_add3 IS NOT DISTINCT FROM bio_perm_add3
+          AND num_nonnulls(bio_temp_add1, bio_temp_add2, bio_temp_add3) > 0
+    """)
+
+
+def downgrade():
+    # Restore the copied addresses before dropping the flags
+    op.execute("""
+        UPDATE rc_data
+        SET present_address = permanent_address
+        WHERE present_same_as_permanent
+    """)
+    op.execute("""
+        UPDATE licence_data
+        SET bio_temp_add1 = bio_perm_add1, bio_temp_add2 = bio_perm_add2, bio_temp_add3 = bio_perm_add3
+        WHERE bio_temp_same_as_perm
+    """)
+    op.drop_column('licence_data', 'bio_temp_same_as_perm')
+    op.drop_column('rc_data', 'present_same_as_permanent')
@@ -0,0 +1,39 @@
+"""add credits remaining to users
+
+Revision ID: credits_remaining_001
+Revises: encrypt_pii_001
+Create Date: 2025-12-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'credits_remaining_001'
+down_revision = 'encrypt_pii_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Generated column so credit checks read a single value
+    op.add_column(
+        'users',
+        sa.Column(
+            'credits_remaining',
+            sa.Numeric(precision=10, scale=2),
+            sa.Computed('total_credits - credits_used', persisted=True),
+        ),
+    )
+    # Partial index over users that still have credits
+    op.create_index(
+        'ix_users_has_credits',
+        'users',
+        ['id'],
+        postgresql_where=sa.text('total_credits > credits_used'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_users_has_credits', table_name='users')
+    op.drop_column('users', 'credits_remaining')
@@ -0,0 +1,48 @@
+"""add lower() expression indexes
+
+Revision ID: lower_indexes_001
+Revises: updated_at_trigger_001
+Create Date: 2025-12-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'lower_indexes_001'
+down_revision = 'updated_at_trigger_001'
+branch_labels = None
+depends_on = None
+
+
+def _existing_tables():
+    # voter_id_data / udyam_data were created with create_all rather than migrations
+    from sqlalchemy import inspect
+    return set(inspect(op.get_bind()).get_table_names())
+
+
+def upgrade():
+    # Email lookups are case-insensitive; the unique index moves to lower(email)
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+    op.drop_index('ix_users_email', table_name='users')
+
+    tables = _existing_tables()
+    if 'voter_id_data' in tables:
+        op.execute('DROP INDEX IF EXISTS ix_voter_id_data_name')
+        op.create_index('ix_voter_id_data_name_lower', 'voter_id_data', [sa.text('lower(name)')])
+    if 'udyam_data' in tables:
+        op.execute('DROP INDEX IF EXISTS ix_udyam_data_enterprise_name')
+        op.create_index('ix_udyam_data_enterprise_name_lower', 'udyam_data', [sa.text('lower(enterprise_name)')])
+
+
+def downgrade():
+    tables = _existing_tables()
+    if 'udyam_data' in tables:
+        op.drop_index('ix_udyam_data_enterprise_name_lower', table_name='udyam_data')
+        op.create_index('ix_udyam_data_enterprise_name', 'udyam_data', ['enterprise_name'], unique=False)
+    if 'voter_id_data' in tables:
+        op.drop_index('ix_voter_id_data_name_lower', table_name='voter_id_data')
+        op.create_index('ix_voter_id_data_name', 'voter_id_data', ['name'], unique=False)
+
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.drop_index('ix_users_email_lower', table_name='users')
@@ -0,0 +1,43 @@
+"""add payment status check constraint
+
+Revision ID: payment_status_check_001
+Revises: fb14a29d7d0f
+Create Date: 2025-12-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'payment_status_check_001'
+down_revision = 'fb14a29d7d0f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Shrink payment_status to a short VARCHAR (SQLAlchemy stores enum member names)
+    op.alter_column(
+        'transactions',
+        'payment_status',
+        type_=sa.String(length=16),
+        existing_type=sa.String(),
+        existing_nullable=False,
+    )
+    # Guard allowed values in the database instead of relying on Python-side coercion only
+    op.create_check_constraint(
+        'payment_status',
+        'transactions',
+        "payment_status IN ('PENDING', 'COMPLETED', 'FAILED')",
+    )
+
+
+def downgrade():
+    op.drop_constraint('payment_status', 'transactions', type_='check')
+    op.alter_column(
+        'transactions',
+        'payment_status',
+        type_=sa.String(),
+        existing_type=sa.String(length=16),
+        existing_nullable=False,
+    )
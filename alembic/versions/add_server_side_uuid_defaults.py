@@ -0,0 +1,68 @@
+"""add server side uuid defaults
+
+Revision ID: uuid_server_default_001
+Revises: payment_status_check_001
+Create Date: 2025-12-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'uuid_server_default_001'
+down_revision = 'payment_status_check_001'
+branch_labels = None
+depends_on = None
+
+
+# Tables whose String primary key is now generated by PostgreSQL
+UUID_PK_TABLES = [
+    'users',
+    'api_tokens',
+    'api_keys',
+    'api_usage_logs',
+    'transactions',
+    'industries',
+    'categories',
+    'services',
+    'service_industries',
+    'user_service_access',
+    'pricing_plans',
+    'external_api_configs',
+    'rc_data',
+    'rc_mobile_data',
+    'licence_data',
+    'licence_coverages',
+    'challan_data',
+    'challan_records',
+    'challan_offences',
+    'dl_challan_data',
+    'pan_data',
+    'gst_data',
+    'msme_data',
+    'udyam_data',
+    'address_verification_data',
+    'voter_id_data',
+    'fuel_price_data',
+]
+
+
+def _existing_tables():
+    # Some data tables were created with create_all rather than migrations
+    from sqlalchemy import inspect
+    return set(inspect(op.get_bind()).get_table_names())
+
+
+def upgrade():
+    # gen_random_uuid() is built into PostgreSQL 13+
+    tables = _existing_tables()
+    for table in UUID_PK_TABLES:
+        if table in tables:
+            op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()::text'))
+
+
+def downgrade():
+    tables = _existing_tables()
+    for table in UUID_PK_TABLES:
+        if table in tables:
+            op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,91 @@
+"""add updated_at triggers and brin index
+
+Revision ID: updated_at_trigger_001
+Revises: uuid_server_default_001
+Create Date: 2025-12-01 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'updated_at_trigger_001'
+down_revision = 'uuid_server_default_001'
+branch_labels = None
+depends_on = None
+
+
+# Tables with an updated_at column. The models also set onupdate=func.now(), so
+# tables created by init_db() without this trigger still get fresh values; the
+# trigger covers UPDATEs issued outside the ORM
+UPDATED_AT_TABLES = [
+    'users',
+    'api_keys',
+    'transactions',
+    'industries',
+    'categories',
+    'services',
+    'user_service_access',
+    'pricing_plans',
+    'external_api_configs',
+    'system_configs',
+    'rc_data',
+    'rc_mobile_data',
+    'licence_data',
+    'challan_data',
+    'challan_records',
+    'dl_challan_data',
+    'pan_data',
+    'gst_data',
+    'msme_data',
+    'udyam_data',
+    'address_verification_data',
+    'voter_id_data',
+    'fuel_price_data',
+]
+
+
+def _existing_tables():
+    # Some data tables were created with create_all rather than migrations
+    from sqlalchemy import inspect
+    return set(inspect(op.get_bind()).get_table_names())
+
+
+def upgrade():
+    # Maintain updated_at in the database so UPDATEs no longer send it from the client
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    tables = _existing_tables()
+    for table in UPDATED_AT_TABLES:
+        if table in tables:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+            op.execute(
+                f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+                f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+            )
+
+    # Replace the B-tree on the append-only usage log timestamp with a BRIN index
+    op.drop_index('ix_api_usage_logs_created_at', table_name='api_usage_logs')
+    op.create_index(
+        'ix_api_usage_logs_created_at_brin',
+        'api_usage_logs',
+        ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade():
+    op.drop_index('ix_api_usage_logs_created_at_brin', table_name='api_usage_logs')
+    op.create_index('ix_api_usage_logs_created_at', 'api_usage_logs', ['created_at'], unique=False)
+
+    tables = _existing_tables()
+    for table in UPDATED_AT_TABLES:
+        if table in tables:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,79 @@
+"""encrypt user pii columns
+
+Revision ID: encrypt_pii_001
+Revises: lower_indexes_001
+Create Date: 2025-12-01 00:00:00.000000
+
+"""
+import base64
+import hashlib
+import os
+from alembic import op
+import sqlalchemy as sa
+from cryptography.hazmat.primitives.ciphers.aead import AESSIV
+
+# revision identifiers, used by Alembic.
+revision = 'encrypt_pii_001'
+down_revision = 'lower_indexes_001'
+branch_labels = None
+depends_on = None
+
+
+PII_COLUMNS = ['aadhar_number', 'pan_number']
+
+
+def _pii_cipher():
+    # Key derivation as of this revision, kept here rather than imported so
+    # later changes to app code cannot alter what this migration writes
+    key = os.environ.get('PII_ENCRYPTION_KEY')
+    if not key:
+        raise RuntimeError('Set PII_ENCRYPTION_KEY in the environment to run encrypt_pii_001')
+    return AESSIV(hashlib.sha512(b"pii:" + key.encode()).digest())
+
+
+def _rewrite_pii(transform):
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text("SELECT id, aadhar_number, pan_number FROM users "
+                "WHERE aadhar_number IS NOT NULL OR pan_number IS NOT NULL")
+    ).mappings().all()
+    if not rows:
+        return
+    cipher = _pii_cipher()
+    for row in rows:
+        values = {column: transform(cipher, row[column]) for column in PII_COLUMNS}
+        conn.execute(
+            sa.text("UPDATE users SET aadhar_number = :aadhar_number, pan_number = :pan_number WHERE id = :id"),
+            {"id": row["id"], **values},
+        )
+
+
+def _try_decrypt(cipher, value):
+    try:
+        return cipher.decrypt(base64.urlsafe_b64decode(value.encode()), None).decode()
+    except Exception:
+        return None
+
+
+def _encrypt(cipher, value):
+    # Skip NULLs and values that are already valid ciphertext
+    if value is None or _try_decrypt(cipher, value) is not None:
+        return value
+    return base64.urlsafe_b64encode(cipher.encrypt(value.encode(), None)).decode()
+
+
+def _decrypt(cipher, value):
+    if value is None:
+        return None
+    decrypted = _try_decrypt(cipher, value)
+    return decrypted if decrypted is not None else value
+
+
+def upgrade():
+    # Encrypt existing plaintext Aadhaar/PAN numbers with deterministic AES-SIV
+    _rewrite_pii(_encrypt)
+
+
+def downgrade():
+    # Restore plaintext values
+    _rewrite_pii(_decrypt)
@@ -0,0 +1,49 @@
+"""store api token hash as bytea
+
+Revision ID: token_hash_bytea_001
+Revises: paise_amounts_001
+Create Date: 2025-12-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'token_hash_bytea_001'
+down_revision = 'paise_amounts_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Hex SHA-256 text -> raw 32-byte digest
+    op.drop_index('ix_api_tokens_token_hash', table_name='api_tokens')
+    op.alter_column(
+        'api_tokens',
+        'token_hash',
+        type_=sa.LargeBinary(length=32),
+        existing_type=sa.String(),
+        existing_nullable=False,
+        postgresql_using="decode(token_hash, 'hex')",
+    )
+    # Partial unique index over tokens that have not been revoked
+    op.create_index(
+        'ix_api_tokens_active',
+        'api_tokens',
+        ['token_hash'],
+        unique=True,
+        postgresql_where=sa.text('revoked_at IS NULL'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_api_tokens_active', table_name='api_tokens')
+    op.alter_column(
+        'api_tokens',
+        'token_hash',
+        type_=sa.String(),
+        existing_type=sa.LargeBinary(length=32),
+        existing_nullable=False,
+        postgresql_using="encode(token_hash, 'hex')",
+    )
+    op.create_index('ix_api_tokens_token_hash', 'api_tokens', ['token_hash'], unique=True)
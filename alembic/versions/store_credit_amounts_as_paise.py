@@ -0,0 +1,47 @@
+"""store credit amounts as paise
+
+Revision ID: paise_amounts_001
+Revises: credits_remaining_001
+Create Date: 2025-12-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'paise_amounts_001'
+down_revision = 'credits_remaining_001'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs moving from NUMERIC(10, 2) to BIGINT hundredths
+PAISE_COLUMNS = [
+    ('transactions', 'amount_paid'),
+    ('transactions', 'credits_purchased'),
+    ('api_usage_logs', 'credits_deducted'),
+    ('api_usage_logs', 'credits_before'),
+    ('api_usage_logs', 'credits_after'),
+]
+
+
+def upgrade():
+    for table, column in PAISE_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.BigInteger(),
+            existing_type=sa.Numeric(precision=10, scale=2),
+            postgresql_using=f'round({column} * 100)::bigint',
+        )
+
+
+def downgrade():
+    for table, column in PAISE_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Numeric(precision=10, scale=2),
+            existing_type=sa.BigInteger(),
+            postgresql_using=f'({column} / 100.0)::numeric(10, 2)',
+        )
@@ -4,7 +4,7 @@ from sqlalchemy import select, func, and_, or_, delete
 from typing import List, Optional
 from datetime import datetime, date, date
 from app.database import get_db
-from app.models.user import User, UserStatus
+from app.models.user import User, UserStatus, USER_STATUS_VALUES
 from app.models.api_key import ApiKey
 from app.models.usage_log import ApiUsageLog
 from app.models.system_config import SystemConfig
@@ -15,6 +15,7 @@ from app.models.service_industry import ServiceIndustry
 from app.models.user_service_access import UserServiceAccess
 from app.models.transaction import Transaction, PaymentStatus
 from app.middleware.auth import get_current_admin_user
+from app.core.cache import invalidate_catalog
 from app.schemas.marketplace import (
     IndustryCreate, IndustryResponse,
     CategoryCreate, CategoryResponse,
@@ -24,7 +25,7 @@ from app.schemas.auth import UserCreate, UserResponse
 from app.models.user import UserRole
 from app.websocket.manager import manager
 from app.websocket.events import create_user_registration_event
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import selectinload
 from decimal import Decimal
 import uuid
@@ -95,14 +96,18 @@ async def list_users(
     )
     users = result.scalars().all()
     
-    # Get API call counts for each user
+    # Get API call counts for the whole page in one IN (...) query (selectin-style batching)
+    call_counts = {}
+    if users:
+        counts_result = await db.execute(
+            select(ApiUsageLog.user_id, func.count(ApiUsageLog.id))
+            .where(ApiUsageLog.user_id.in_([user.id for user in users]))
+            .group_by(ApiUsageLog.user_id)
+        )
+        call_counts = dict(counts_result.all())
+    
     response = []
     for user in users:
-        call_count_result = await db.execute(
-            select(func.count(ApiUsageLog.id)).where(ApiUsageLog.user_id == user.id)
-        )
-        call_count = call_count_result.scalar() or 0
-        
         response.append(UserListResponse(
             id=user.id,
             email=user.email,
@@ -110,7 +115,7 @@ async def list_users(
             role=user.role.value,
             status=user.status.value,
             created_at=user.created_at,
-            total_api_calls=call_count
+            total_api_calls=call_counts.get(user.id, 0)
         ))
     
     return response
@@ -180,7 +185,7 @@ async def create_user(
     
     # Check if user already exists
     result = await db.execute(
-        select(User).where(User.email == user_data.email)
+        select(User).where(func.lower(User.email) == user_data.email.lower())
     )
     existing_user = result.scalar_one_or_none()
     
@@ -301,7 +306,7 @@ async def update_user_status(
             detail="User not found"
         )
     
-    if status_update.status not in ["active", "inactive"]:
+    if status_update.status not in USER_STATUS_VALUES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid status. Must be 'active' or 'inactive'"
@@ -369,7 +374,7 @@ async def update_user(
                 detail="Invalid email format"
             )
         existing_result = await db.execute(
-            select(User).where(User.email == user_update.email)
+            select(User).where(func.lower(User.email) == user_update.email.lower(), User.id != user.id)
         )
         existing_user = existing_result.scalar_one_or_none()
         if existing_user:
@@ -580,9 +585,10 @@ async def create_industry(
             detail="Industry with this slug already exists"
         )
     
-    industry = Industry(**industry_data.dict())
+    industry = Industry(**industry_data.model_dump())
     db.add(industry)
     await db.commit()
+    await invalidate_catalog()
     await db.refresh(industry)
     return industry
 
@@ -611,10 +617,11 @@ async def update_industry(
     if not industry:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Industry not found")
     
-    for key, value in industry_data.dict().items():
+    for key, value in industry_data.model_dump().items():
         setattr(industry, key, value)
     
     await db.commit()
+    await invalidate_catalog()
     await db.refresh(industry)
     return industry
 
@@ -626,7 +633,12 @@ async def delete_industry(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete an industry"""
-    result = await db.execute(select(Industry).where(Industry.id == industry_id))
+    # Load cascaded mappings up front (relationships are lazy="raise_on_sql")
+    result = await db.execute(
+        select(Industry)
+        .where(Industry.id == industry_id)
+        .options(selectinload(Industry.service_industries))
+    )
     industry = result.scalar_one_or_none()
     
     if not industry:
@@ -634,6 +646,7 @@ async def delete_industry(
     
     db.delete(industry)
     await db.commit()
+    await invalidate_catalog()
     return {"message": "Industry deleted successfully"}
 
 
@@ -653,9 +666,10 @@ async def create_category(
             detail="Category with this slug already exists"
         )
     
-    category = Category(**category_data.dict())
+    category = Category(**category_data.model_dump())
     db.add(category)
     await db.commit()
+    await invalidate_catalog()
     await db.refresh(category)
     return category
 
@@ -684,10 +698,11 @@ async def update_category(
     if not category:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
     
-    for key, value in category_data.dict().items():
+    for key, value in category_data.model_dump().items():
         setattr(category, key, value)
     
     await db.commit()
+    await invalidate_catalog()
     await db.refresh(category)
     return category
 
@@ -699,7 +714,11 @@ async def delete_category(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a category"""
-    result = await db.execute(select(Category).where(Category.id == category_id))
+    result = await db.execute(
+        select(Category)
+        .where(Category.id == category_id)
+        .options(selectinload(Category.services))
+    )
     category = result.scalar_one_or_none()
     
     if not category:
@@ -707,6 +726,7 @@ async def delete_category(
     
     db.delete(category)
     await db.commit()
+    await invalidate_catalog()
     return {"message": "Category deleted successfully"}
 
 
@@ -727,7 +747,7 @@ async def create_service(
         )
     
     # Create service
-    service_dict = service_data.dict(exclude={"industry_ids"})
+    service_dict = service_data.model_dump(exclude={"industry_ids"})
     service = Service(**service_dict)
     db.add(service)
     await db.flush()
@@ -742,6 +762,7 @@ async def create_service(
             db.add(service_industry)
     
     await db.commit()
+    await invalidate_catalog()
     await db.refresh(service)
     
     # Load relationships
@@ -783,7 +804,7 @@ async def update_service(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Service not found")
     
     # Update service fields
-    service_dict = service_data.dict(exclude={"industry_ids"})
+    service_dict = service_data.model_dump(exclude={"industry_ids"})
     for key, value in service_dict.items():
         setattr(service, key, value)
     
@@ -802,7 +823,17 @@ async def update_service(
             db.add(service_industry)
     
     await db.commit()
-    await db.refresh(service)
+    await invalidate_catalog()
+    
+    # Load relationships
+    result = await db.execute(
+        select(Service)
+        .where(Service.id == service.id)
+        .options(selectinload(Service.category), selectinload(Service.service_industries))
+        .execution_options(populate_existing=True)
+    )
+    service = result.scalar_one()
+    
     return service
 
 
@@ -813,7 +844,16 @@ async def delete_service(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a service"""
-    result = await db.execute(select(Service).where(Service.id == service_id))
+    result = await db.execute(
+        select(Service)
+        .where(Service.id == service_id)
+        .options(
+            selectinload(Service.service_industries),
+            selectinload(Service.user_access),
+            selectinload(Service.api_keys),
+            selectinload(Service.usage_logs),
+        )
+    )
     service = result.scalar_one_or_none()
     
     if not service:
@@ -821,6 +861,7 @@ async def delete_service(
     
     db.delete(service)
     await db.commit()
+    await invalidate_catalog()
     return {"message": "Service deleted successfully"}
 
 
@@ -988,19 +1029,27 @@ async def get_user_api_keys(
     result = await db.execute(
         select(ApiKey)
         .where(ApiKey.user_id == user_id)
-        .options(selectinload(ApiKey.service))
         .order_by(ApiKey.created_at.desc())
     )
     api_keys = result.scalars().all()
     
+    # Load every service the keys reference in one query, not one per id
+    service_ids = {key.service_id for key in api_keys if key.service_id}
+    for key in api_keys:
+        if key.allowed_services and "*" not in key.allowed_services:
+            service_ids.update(key.allowed_services)
+    services_by_id = {}
+    if service_ids:
+        svc_result = await db.execute(select(Service).where(Service.id.in_(service_ids)))
+        services_by_id = {svc.id: svc for svc in svc_result.scalars()}
+    
     response_list = []
     for key in api_keys:
         services_list = []
         if key.allowed_services:
             if "*" not in key.allowed_services:
                 for svc_id in key.allowed_services:
-                    svc_result = await db.execute(select(Service).where(Service.id == svc_id))
-                    svc = svc_result.scalar_one_or_none()
+                    svc = services_by_id.get(svc_id)
                     if svc:
                         services_list.append(ServiceResponse(
                             id=svc.id,
@@ -1020,20 +1069,21 @@ async def get_user_api_keys(
                         ))
         
         single_service = None
-        if key.service:
+        service = services_by_id.get(key.service_id)
+        if service:
             single_service = ServiceResponse(
-                id=key.service.id,
-                name=key.service.name,
-                slug=key.service.slug,
-                category_id=key.service.category_id,
-                description=key.service.description,
-                endpoint_path=key.service.endpoint_path,
-                request_schema=key.service.request_schema,
-                response_schema=key.service.response_schema,
-                price_per_call=float(key.service.price_per_call),
-                is_active=key.service.is_active,
-                created_at=key.service.created_at,
-                updated_at=key.service.updated_at,
+                id=service.id,
+                name=service.name,
+                slug=service.slug,
+                category_id=service.category_id,
+                description=service.description,
+                endpoint_path=service.endpoint_path,
+                request_schema=service.request_schema,
+                response_schema=service.response_schema,
+                price_per_call=float(service.price_per_call),
+                is_active=service.is_active,
+                created_at=service.created_at,
+                updated_at=service.updated_at,
             category=None,
             industries=None
             )
@@ -1145,7 +1195,7 @@ async def allocate_credits_to_user(
         "user_id": user_id,
         "credits_allocated": float(credit_data.credits_amount),
         "total_credits": float(user.total_credits),
-        "credits_remaining": float(user.total_credits - user.credits_used)
+        "credits_remaining": float(user.credits_remaining)
     }
 
 
@@ -1205,9 +1255,9 @@ async def get_user_credit_info(
         "full_name": user.full_name,
         "total_credits": float(user.total_credits),
         "credits_used": float(user.credits_used),
-        "credits_remaining": float(user.total_credits - user.credits_used),
+        "credits_remaining": float(user.credits_remaining),
         "price_per_credit": float(user.price_per_credit),
-        "effective_balance_value": float((user.total_credits - user.credits_used) * user.price_per_credit)
+        "effective_balance_value": float(user.credits_remaining * user.price_per_credit)
     }
 
 
@@ -1227,8 +1277,7 @@ class UserServiceAccessResponse(BaseModel):
     granted_at: datetime
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 @router.post("/users/{user_id}/service-access", response_model=UserServiceAccessResponse, status_code=status.HTTP_201_CREATED)
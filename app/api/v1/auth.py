@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 from pydantic import BaseModel
 from app.database import get_db
 from app.models.user import User, UserRole, UserStatus
@@ -25,7 +25,7 @@ async def register(
     """Register a new client user"""
     # Check if user already exists
     result = await db.execute(
-        select(User).where(User.email == user_data.email)
+        select(User).where(func.lower(User.email) == user_data.email.lower())
     )
     existing_user = result.scalar_one_or_none()
     
@@ -73,7 +73,7 @@ async def login(
     """Login and get access/refresh tokens"""
     # Find user by email
     result = await db.execute(
-        select(User).where(User.email == credentials.email)
+        select(User).where(func.lower(User.email) == credentials.email.lower())
     )
     user = result.scalar_one_or_none()
     
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, delete
 from typing import List, Optional
@@ -15,6 +15,7 @@ from app.models.industry import Industry
 from app.models.service_industry import ServiceIndustry
 from app.middleware.auth import get_current_active_user
 from app.core.security import generate_api_key
+from app.core.cache import get_cached_catalog, set_cached_catalog
 from app.schemas.marketplace import (
     TransactionCreate, TransactionResponse,
     CreditPurchaseRequest, CreditPurchaseResponse,
@@ -26,13 +27,16 @@ from app.websocket.events import (
     create_credit_purchase_event,
     create_credit_balance_update_event
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.orm import selectinload
 from decimal import Decimal
 import uuid
 
 router = APIRouter()
 
+# Serializes catalog listings straight to JSON bytes (pydantic-core, no FastAPI encoder pass)
+_service_list_adapter = TypeAdapter(List[ServiceResponse])
+
 
 # Schemas
 class ApiKeyCreate(BaseModel):
@@ -79,9 +83,9 @@ async def delete_api_key(
 ):
     """Delete an API key permanently from database"""
     result = await db.execute(
-        select(ApiKey).where(
-            and_(ApiKey.id == key_id, ApiKey.user_id == current_user.id)
-        )
+        select(ApiKey)
+        .where(and_(ApiKey.id == key_id, ApiKey.user_id == current_user.id))
+        .options(selectinload(ApiKey.usage_logs))
     )
     api_key = result.scalar_one_or_none()
     
@@ -217,6 +221,11 @@ async def browse_services(
     db: AsyncSession = Depends(get_db)
 ):
     """Browse available services (filter by category/industry)"""
+    cache_key = f"services:{category_id or '*'}:{industry_id or '*'}"
+    cached = await get_cached_catalog(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
     query = select(Service).where(Service.is_active == True)
     
     if category_id:
@@ -231,7 +240,11 @@ async def browse_services(
     )
     services = result.scalars().all()
     
-    return services
+    payload = _service_list_adapter.dump_json(
+        _service_list_adapter.validate_python(services, from_attributes=True)
+    )
+    await set_cached_catalog(cache_key, payload)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/services/{service_id}", response_model=ServiceResponse)
@@ -425,11 +438,20 @@ async def list_api_keys_by_service(
     result = await db.execute(
         select(ApiKey)
         .where(ApiKey.user_id == current_user.id)
-        .options(selectinload(ApiKey.service))
         .order_by(ApiKey.created_at.desc())
     )
     api_keys = result.scalars().all()
     
+    # Load every service the keys reference in one query, not one per id
+    service_ids = {key.service_id for key in api_keys if key.service_id}
+    for key in api_keys:
+        if key.allowed_services and "*" not in key.allowed_services:
+            service_ids.update(key.allowed_services)
+    services_by_id = {}
+    if service_ids:
+        svc_result = await db.execute(select(Service).where(Service.id.in_(service_ids)))
+        services_by_id = {svc.id: svc for svc in svc_result.scalars()}
+    
     response_list = []
     for key in api_keys:
         # Load services for multi-service keys
@@ -441,8 +463,7 @@ async def list_api_keys_by_service(
             else:
                 # Load specific services
                 for svc_id in key.allowed_services:
-                    svc_result = await db.execute(select(Service).where(Service.id == svc_id))
-                    svc = svc_result.scalar_one_or_none()
+                    svc = services_by_id.get(svc_id)
                     if svc:
                         services_list.append(ServiceResponse(
                             id=svc.id,
@@ -463,20 +484,21 @@ async def list_api_keys_by_service(
         
         # Backward compatibility: include service if single service key
         single_service = None
-        if key.service:
+        service = services_by_id.get(key.service_id)
+        if service:
             single_service = ServiceResponse(
-                id=key.service.id,
-                name=key.service.name,
-                slug=key.service.slug,
-                category_id=key.service.category_id,
-                description=key.service.description,
-                endpoint_path=key.service.endpoint_path,
-                request_schema=key.service.request_schema,
-                response_schema=key.service.response_schema,
-                price_per_call=float(key.service.price_per_call),
-                is_active=key.service.is_active,
-                created_at=key.service.created_at,
-                updated_at=key.service.updated_at,
+                id=service.id,
+                name=service.name,
+                slug=service.slug,
+                category_id=service.category_id,
+                description=service.description,
+                endpoint_path=service.endpoint_path,
+                request_schema=service.request_schema,
+                response_schema=service.response_schema,
+                price_per_call=float(service.price_per_call),
+                is_active=service.is_active,
+                created_at=service.created_at,
+                updated_at=service.updated_at,
                 category=None,
                 industries=None
             )
@@ -539,7 +561,7 @@ async def get_credit_balance(
     current_user: User = Depends(get_current_active_user)
 ):
     """Check credit balance"""
-    credits_remaining = float(current_user.total_credits - current_user.credits_used)
+    credits_remaining = float(current_user.credits_remaining)
     
     return {
         "total_credits": float(current_user.total_credits),
@@ -2,7 +2,8 @@
 Generic service execution endpoint
 Handles all service types with API key validation, user service access check, and credit deduction
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Header, Body, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Header, Body, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
@@ -13,8 +14,10 @@ from app.models.api_key import ApiKey, ApiKeyStatus
 from app.models.user import User, UserStatus
 from app.middleware.api_key import verify_api_key
 from app.core.service_engine import ServiceEngine
+from app.core.cache import get_cached_catalog, set_cached_catalog
 from datetime import datetime
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -61,11 +64,12 @@ async def execute_service(
     has_access = False
     access_reason = ""
     
-    if api_key.allowed_services:
-        if "*" in api_key.allowed_services:
+    allowed = api_key.allowed_service_set
+    if allowed:
+        if "*" in allowed:
             has_access = True  # All services access
             access_reason = "all services (wildcard)"
-        elif service.id in api_key.allowed_services:
+        elif service.id in allowed:
             has_access = True  # Specific service in allowed list
             access_reason = f"service '{service.name}' in allowed list"
     elif api_key.service_id == service.id:
@@ -74,7 +78,7 @@ async def execute_service(
     
     if not has_access:
         # Provide detailed error message
-        allowed_info = "all services" if (api_key.allowed_services and "*" in api_key.allowed_services) else f"{len(api_key.allowed_services or [])} specific service(s)"
+        allowed_info = "all services" if "*" in allowed else f"{len(allowed)} specific service(s)"
         error_msg = (
             f"API key does not have access to service '{service_slug}' ({service.name}). "
             f"This key has access to: {allowed_info}. "
@@ -96,7 +100,9 @@ async def execute_service(
             api_key=api_key,
             payload=payload
         )
-        return result
+        # Engine payloads are already JSON-ready; hand them straight to orjson
+        # instead of walking them with jsonable_encoder first
+        return ORJSONResponse(content=result)
     except HTTPException:
         # Re-raise HTTP exceptions (like 404 for data not found)
         raise
@@ -119,6 +125,10 @@ async def list_services(
     db: AsyncSession = Depends(get_db)
 ):
     """List all active services"""
+    cached = await get_cached_catalog("public-services")
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
     result = await db.execute(
         select(Service)
         .where(Service.is_active == True)
@@ -126,7 +136,7 @@ async def list_services(
     )
     services = result.scalars().all()
     
-    return [
+    payload = orjson.dumps([
         {
             "id": service.id,
             "name": service.name,
@@ -142,7 +152,9 @@ async def list_services(
             "is_active": service.is_active
         }
         for service in services
-    ]
+    ])
+    await set_cached_catalog("public-services", payload)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/services/{service_slug}")
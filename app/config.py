@@ -1,4 +1,5 @@
-from pydantic_settings import BaseSettings
+from pydantic import model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
 from functools import lru_cache
 
@@ -16,6 +17,13 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     
+    # PII encryption (Aadhaar/PAN columns) - separate from the JWT secret so the
+    # JWT secret can be rotated without losing stored data. Never change it once
+    # data is encrypted; databases encrypted before this setting existed must
+    # set it to the JWT_SECRET_KEY in use at the time. No default: required in
+    # production, and outside production an unset key uses a dev-only key
+    PII_ENCRYPTION_KEY: str = ""
+    
     # External APIs - Hardcoded defaults (empty means not configured)
     EXTERNAL_API_1_URL: str = ""
     EXTERNAL_API_1_KEY: str = ""
@@ -36,13 +44,21 @@ class Settings(BaseSettings):
     RC_DATA_TTL_HOURS: int = 24
     DL_DATA_TTL_HOURS: int = 168
     CHALLAN_DATA_TTL_HOURS: int = 12
+    CATALOG_CACHE_TTL_SECONDS: int = 300
     
     # Environment - Hardcoded default
     ENVIRONMENT: str = "development"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
+    
+    @model_validator(mode="after")
+    def check_pii_encryption_key(self) -> "Settings":
+        """Refuse to start in production with an unset or publicly known PII key"""
+        if self.ENVIRONMENT == "production" and self.PII_ENCRYPTION_KEY in (
+            "", type(self).model_fields["JWT_SECRET_KEY"].default
+        ):
+            raise ValueError("PII_ENCRYPTION_KEY must be set to a private value in production")
+        return self
     
     @property
     def cors_origins(self) -> List[str]:
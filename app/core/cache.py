@@ -0,0 +1,52 @@
+"""
+Redis cache for pre-serialized catalog responses
+The marketplace catalog is read on every UI navigation but changes rarely, so the
+JSON bytes are cached and served directly without touching the ORM or Pydantic
+"""
+from typing import Optional
+import logging
+import redis.asyncio as redis
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+CATALOG_KEY_PREFIX = "catalog:"
+
+_redis_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """Get the shared Redis client (created on first use)"""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
+async def get_cached_catalog(key: str) -> Optional[bytes]:
+    """Get cached catalog bytes (None on miss or if Redis is unavailable)"""
+    try:
+        return await get_redis().get(CATALOG_KEY_PREFIX + key)
+    except redis.RedisError as e:
+        logger.warning(f"Catalog cache read failed for {key}: {e}")
+        return None
+
+
+async def set_cached_catalog(key: str, payload: bytes) -> None:
+    """Store catalog bytes with the configured TTL"""
+    try:
+        await get_redis().set(CATALOG_KEY_PREFIX + key, payload, ex=settings.CATALOG_CACHE_TTL_SECONDS)
+    except redis.RedisError as e:
+        logger.warning(f"Catalog cache write failed for {key}: {e}")
+
+
+async def invalidate_catalog() -> None:
+    """Drop all cached catalog responses (call after catalog writes)"""
+    try:
+        client = get_redis()
+        keys = [key async for key in client.scan_iter(match=CATALOG_KEY_PREFIX + "*")]
+        if keys:
+            await client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning(f"Catalog cache invalidation failed: {e}")
@@ -6,6 +6,7 @@ from app.config import get_settings
 import secrets
 import hashlib
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESSIV
 import base64
 
 settings = get_settings()
@@ -103,3 +104,25 @@ def decrypt_api_key(encrypted_key: str) -> Optional[str]:
     except Exception:
         return None
 
+
+# Used only outside production when PII_ENCRYPTION_KEY is unset (see Settings)
+_DEV_PII_ENCRYPTION_KEY = "dev-only-pii-encryption-key-never-use-in-production"
+
+# Deterministic AES-SIV cipher for PII columns: the same plaintext always yields the
+# same ciphertext, so encrypted columns stay usable for equality lookups on an index
+_pii_cipher = AESSIV(
+    hashlib.sha512(b"pii:" + (settings.PII_ENCRYPTION_KEY or _DEV_PII_ENCRYPTION_KEY).encode()).digest()
+)
+
+
+def encrypt_pii(value: str) -> str:
+    """Deterministically encrypt a PII value for storage"""
+    return base64.urlsafe_b64encode(_pii_cipher.encrypt(value.encode(), None)).decode()
+
+
+def decrypt_pii(encrypted_value: str) -> Optional[str]:
+    """Decrypt a PII value from storage (None if it is not valid ciphertext)"""
+    try:
+        return _pii_cipher.decrypt(base64.urlsafe_b64decode(encrypted_value.encode()), None).decode()
+    except Exception:
+        return None
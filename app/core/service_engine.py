@@ -29,13 +29,12 @@ from app.models.msme_data import MSMEData
 from app.models.udyam_data import UdyamData
 from app.models.voter_id_data import VoterIDData
 from app.models.dl_challan_data import DLChallanData
+from app.schemas.voter_id import VoterIDData as VoterIDDataSchema
 from app.config import get_settings
 from app.websocket.manager import manager
-from app.websocket.events import (
-    create_api_call_event,
-    create_credit_balance_update_event
-)
+from app.websocket.events import create_api_call_and_balance_events
 import logging
+import orjson
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -73,7 +72,7 @@ class ServiceEngine:
         user = user_result.scalar_one()
         
         credits_needed = service.price_per_call
-        user_credits_before = float(user.total_credits - user.credits_used)
+        user_credits_before = float(user.credits_remaining)
         
         # 1. Check user has access to this service
         from app.models.user_service_access import UserServiceAccess
@@ -132,47 +131,31 @@ class ServiceEngine:
         
         # 6. Broadcast to WebSocket
         try:
-            # Broadcast to user
-            await manager.send_personal_message(
-                create_api_call_event(
-                    user_id=user.id,
-                    service_id=service.id,
-                    service_name=service.name,
-                    api_key_id=api_key.id,
-                    credits_deducted=float(credits_needed),
-                    credits_before=credits_before,
-                    credits_after=credits_after,
-                    response_status=response_status,
-                    response_time_ms=response_time_ms
-                ),
-                user.id
+            api_call_event, balance_event = create_api_call_and_balance_events(
+                user_id=user.id,
+                service_id=service.id,
+                service_name=service.name,
+                api_key_id=api_key.id,
+                credits_deducted=float(credits_needed),
+                credits_before=credits_before,
+                credits_after=credits_after,
+                response_status=response_status,
+                response_time_ms=response_time_ms,
+                total_credits=float(user.total_credits),
+                credits_used=float(user.credits_used),
+                credits_remaining=user_credits_after
             )
+            # The user and admin get the same API call frame; encode it once
+            api_call_text = orjson.dumps(api_call_event).decode()
+            
+            # Broadcast to user
+            await manager.send_personal_message(api_call_event, user.id, api_call_text)
             
             # Broadcast credit balance update
-            await manager.send_personal_message(
-                create_credit_balance_update_event(
-                    user_id=user.id,
-                    total_credits=float(user.total_credits),
-                    credits_used=float(user.credits_used),
-                    credits_remaining=user_credits_after
-                ),
-                user.id
-            )
+            await manager.send_balance_update(balance_event, user.id)
             
             # Broadcast to admin
-            await manager.broadcast_to_admin(
-                create_api_call_event(
-                    user_id=user.id,
-                    service_id=service.id,
-                    service_name=service.name,
-                    api_key_id=api_key.id,
-                    credits_deducted=float(credits_needed),
-                    credits_before=credits_before,
-                    credits_after=credits_after,
-                    response_status=response_status,
-                    response_time_ms=response_time_ms
-                )
-            )
+            await manager.broadcast_to_admin(api_call_event, api_call_text)
         except Exception as e:
             logger.error(f"Error broadcasting WebSocket event: {e}")
         
@@ -751,35 +734,11 @@ class ServiceEngine:
         data = result.scalar_one_or_none()
         
         if data:
+            # Trusted DB row: from_row skips validation
             return {
                 "status": 200,
                 "message": "Submitted successfully",
-                "data": {
-                    "epic_number": data.epic_number,
-                    "status": data.status,
-                    "name": data.name,
-                    "name_in_regional_lang": data.name_in_regional_lang,
-                    "age": data.age,
-                    "relation_type": data.relation_type,
-                    "relation_name": data.relation_name,
-                    "relation_name_in_regional_lang": data.relation_name_in_regional_lang,
-                    "father_name": data.father_name,
-                    "dob": data.dob,
-                    "gender": data.gender,
-                    "state": data.state,
-                    "assembly_constituency_number": data.assembly_constituency_number,
-                    "assembly_constituency": data.assembly_constituency,
-                    "parliamentary_constituency_number": data.parliamentary_constituency_number,
-                    "parliamentary_constituency": data.parliamentary_constituency,
-                    "part_number": data.part_number,
-                    "part_name": data.part_name,
-                    "serial_number": data.serial_number,
-                    "polling_station": data.polling_station,
-                    "address": data.address,
-                    "photo": data.photo,
-                    "split_address": data.split_address or {},
-                    "urn": data.urn
-                },
+                "data": {**dict(VoterIDDataSchema.from_row(data)), "split_address": data.split_address or {}},
                 "data_source": data.data_source
             }
         
@@ -1,5 +1,6 @@
+import orjson
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import DeclarativeBase
 from typing import AsyncGenerator
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from app.config import get_settings
@@ -63,6 +64,11 @@ def convert_postgres_url_to_asyncpg(url: str) -> str:
     return converted_url
 
 
+def _json_serializer(value) -> str:
+    """Serialize JSON columns with orjson instead of stdlib json.dumps"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine with connection pooling
 # Convert database URL and handle errors gracefully
 try:
@@ -81,6 +87,8 @@ engine = create_async_engine(
     max_overflow=20,
     pool_pre_ping=True,  # Verify connections before using
     pool_recycle=3600,   # Recycle connections after 1 hour
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     connect_args={
         "server_settings": {
             "application_name": "apiservices_backend",
@@ -97,8 +105,9 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
-# Base class for models
-Base = declarative_base()
+# Base class for models (SQLAlchemy 2.0 declarative; supports both Mapped[] and legacy Column attributes)
+class Base(DeclarativeBase):
+    pass
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -1,9 +1,11 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 from app.config import get_settings
 from app.database import init_db
+from app.schemas.voter_id import VoterIDResponse
 
 settings = get_settings()
 
@@ -13,6 +15,8 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events"""
     # Startup
     await init_db()
+    # Voter ID schemas defer their build; compile them once before serving
+    VoterIDResponse.model_rebuild(force=True)
     yield
     # Shutdown
     pass
@@ -25,6 +29,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson serializes responses much faster than stdlib json
 )
 
 # Add CORS middleware
@@ -131,6 +136,10 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
             # Echo back or handle commands
             await websocket.send_json({"type": "pong", "message": "Connection active"})
     except WebSocketDisconnect:
+        pass
+    finally:
+        # Also runs on errors and cancellation, so the socket and its send
+        # task are never left registered
         manager.disconnect(websocket, user_id=user_id)
 
 
@@ -144,5 +153,7 @@ async def websocket_admin_endpoint(websocket: WebSocket):
             data = await websocket.receive_text()
             await websocket.send_json({"type": "pong", "message": "Admin connection active"})
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket, is_admin=True)
 
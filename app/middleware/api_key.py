@@ -1,6 +1,6 @@
 from fastapi import Depends, HTTPException, status, Header, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, update, bindparam
 from typing import Optional
 from app.database import get_db
 from app.models.api_key import ApiKey, ApiKeyStatus
@@ -9,6 +9,13 @@ from app.core.security import hash_api_key
 from datetime import datetime
 from urllib.parse import urlparse
 
+# Built once at import; each request only binds its parameters
+_ACTIVE_API_KEY_QUERY = select(ApiKey).where(
+    ApiKey.key_hash == bindparam("key_hash"),
+    ApiKey.status == ApiKeyStatus.ACTIVE
+)
+_USER_QUERY = select(User).where(User.id == bindparam("user_id"))
+
 
 def check_whitelist_url(api_key: ApiKey, request: Request) -> bool:
     """
@@ -64,12 +71,7 @@ async def verify_api_key(
     key_hash = hash_api_key(x_api_key)
     
     # Find the API key
-    result = await db.execute(
-        select(ApiKey).where(
-            ApiKey.key_hash == key_hash,
-            ApiKey.status == ApiKeyStatus.ACTIVE
-        )
-    )
+    result = await db.execute(_ACTIVE_API_KEY_QUERY, {"key_hash": key_hash})
     api_key = result.scalar_one_or_none()
     
     if api_key is None:
@@ -83,9 +85,7 @@ async def verify_api_key(
         )
     
     # Get associated user
-    result = await db.execute(
-        select(User).where(User.id == api_key.user_id)
-    )
+    result = await db.execute(_USER_QUERY, {"user_id": api_key.user_id})
     user = result.scalar_one_or_none()
     
     if user is None or user.status != UserStatus.ACTIVE:
@@ -1,13 +1,12 @@
-from sqlalchemy import Column, String, DateTime, Integer
+from sqlalchemy import Column, String, DateTime, Integer, text
 from sqlalchemy.sql import func
 from app.database import Base
-import uuid
 
 
 class AddressVerificationData(Base):
     __tablename__ = "address_verification_data"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     aadhaar_no = Column(String, nullable=False, index=True)
     dob = Column(String, nullable=True)
     category = Column(String, nullable=True)
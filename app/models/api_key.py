@@ -1,9 +1,15 @@
-from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, JSON
+from datetime import datetime
+from typing import TYPE_CHECKING, FrozenSet, List, Optional
+from sqlalchemy import String, DateTime, Enum, ForeignKey, JSON, text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 from app.database import Base
-import uuid
+
+if TYPE_CHECKING:
+    from app.models.service import Service
+    from app.models.usage_log import ApiUsageLog
+    from app.models.user import User
 
 
 class ApiKeyStatus(str, enum.Enum):
@@ -14,32 +20,36 @@ class ApiKeyStatus(str, enum.Enum):
 class ApiKey(Base):
     __tablename__ = "api_keys"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id: Mapped[str] = mapped_column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
+    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id", ondelete="CASCADE"), index=True)
     # service_id is now optional - can be null for multi-service keys
-    service_id = Column(String, ForeignKey("services.id", ondelete="CASCADE"), nullable=True, index=True)
-    key_hash = Column(String, nullable=False, unique=True, index=True)
-    key_prefix = Column(String(16), nullable=False)  # First 8-12 chars for display
-    name = Column(String, nullable=False)
-    status = Column(Enum(ApiKeyStatus), nullable=False, default=ApiKeyStatus.ACTIVE)
+    service_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("services.id", ondelete="CASCADE"), index=True)
+    key_hash: Mapped[str] = mapped_column(String, unique=True, index=True)
+    key_prefix: Mapped[str] = mapped_column(String(16))  # First 8-12 chars for display
+    name: Mapped[str] = mapped_column(String)
+    status: Mapped[ApiKeyStatus] = mapped_column(Enum(ApiKeyStatus, name="apikeystatus", native_enum=True), default=ApiKeyStatus.ACTIVE)
     
     # Multi-service access: stores list of service IDs this key can access
     # If null/empty, inherits from subscriptions; if ["*"], all services
-    allowed_services = Column(JSON, nullable=True)  # ["service_id1", "service_id2"] or ["*"]
+    allowed_services: Mapped[Optional[List[str]]] = mapped_column(JSON)  # ["service_id1", "service_id2"] or ["*"]
     
     # Security: Whitelist URLs - API will only respond to requests from these URLs
     # If null/empty, no restriction (allow all)
-    whitelist_urls = Column(JSON, nullable=True)  # ["https://example.com", "https://app.example.com"]
+    whitelist_urls: Mapped[Optional[List[str]]] = mapped_column(JSON)  # ["https://example.com", "https://app.example.com"]
     
     # Encrypted full key for retrieval (encrypted using JWT secret)
-    encrypted_key = Column(String, nullable=True)
+    encrypted_key: Mapped[Optional[str]] = mapped_column(String)
     
-    last_used_at = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
+    last_used_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
     # Relationships
-    user = relationship("User", back_populates="api_keys")
-    service = relationship("Service", back_populates="api_keys")
-    usage_logs = relationship("ApiUsageLog", back_populates="api_key", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship(back_populates="api_keys", lazy="raise_on_sql")
+    service: Mapped[Optional["Service"]] = relationship(back_populates="api_keys", lazy="raise_on_sql")
+    usage_logs: Mapped[List["ApiUsageLog"]] = relationship(back_populates="api_key", cascade="all, delete-orphan", lazy="raise_on_sql")
 
+    @property
+    def allowed_service_set(self) -> FrozenSet[str]:
+        """allowed_services as a frozenset, for hashed membership tests"""
+        return frozenset(self.allowed_services or ())
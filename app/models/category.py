@@ -1,14 +1,13 @@
-from sqlalchemy import Column, String, DateTime, Boolean
+from sqlalchemy import Column, String, DateTime, Boolean, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
-import uuid
 
 
 class Category(Base):
     __tablename__ = "categories"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     name = Column(String, nullable=False, unique=True, index=True)
     slug = Column(String, unique=True, nullable=False, index=True)
     description = Column(String, nullable=True)
@@ -18,5 +17,5 @@ class Category(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
     # Relationships
-    services = relationship("Service", back_populates="category")
+    services = relationship("Service", back_populates="category", lazy="raise_on_sql")
 
@@ -1,14 +1,13 @@
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Text, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
-import uuid
 
 
 class ChallanData(Base):
     __tablename__ = "challan_data"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     vehicle_no = Column(String, nullable=False, index=True)
     
     # Summary counts
@@ -24,13 +23,13 @@ class ChallanData(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
     
     # Relationships
-    records = relationship("ChallanRecord", back_populates="challan_data", cascade="all, delete-orphan")
+    records = relationship("ChallanRecord", back_populates="challan_data", cascade="all, delete-orphan", lazy="raise_on_sql")
 
 
 class ChallanRecord(Base):
     __tablename__ = "challan_records"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     challan_data_id = Column(String, ForeignKey("challan_data.id", ondelete="CASCADE"), nullable=False)
     
     # Vehicle and violator details
@@ -83,14 +82,14 @@ class ChallanRecord(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
     
     # Relationships
-    challan_data = relationship("ChallanData", back_populates="records")
-    offences = relationship("ChallanOffence", back_populates="challan_record", cascade="all, delete-orphan")
+    challan_data = relationship("ChallanData", back_populates="records", lazy="raise_on_sql")
+    offences = relationship("ChallanOffence", back_populates="challan_record", cascade="all, delete-orphan", lazy="raise_on_sql")
 
 
 class ChallanOffence(Base):
     __tablename__ = "challan_offences"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     challan_record_id = Column(String, ForeignKey("challan_records.id", ondelete="CASCADE"), nullable=False)
     
     # Offence details
@@ -101,5 +100,5 @@ class ChallanOffence(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
-    challan_record = relationship("ChallanRecord", back_populates="offences")
+    challan_record = relationship("ChallanRecord", back_populates="offences", lazy="raise_on_sql")
 
@@ -1,13 +1,12 @@
-from sqlalchemy import Column, String, DateTime, Integer, Text
+from sqlalchemy import Column, String, DateTime, Integer, Text, text
 from sqlalchemy.sql import func
 from app.database import Base
-import uuid
 
 
 class DLChallanData(Base):
     __tablename__ = "dl_challan_data"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     dl_no = Column(String, nullable=False, index=True)
     reg_no = Column(String, nullable=True, index=True)
     state = Column(String, nullable=True)
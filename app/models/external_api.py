@@ -1,13 +1,12 @@
-from sqlalchemy import Column, String, DateTime, Integer, Boolean
+from sqlalchemy import Column, String, DateTime, Integer, Boolean, text
 from sqlalchemy.sql import func
 from app.database import Base
-import uuid
 
 
 class ExternalApiConfig(Base):
     __tablename__ = "external_api_configs"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     name = Column(String, nullable=False)
     api_type = Column(String, nullable=False)  # rc, dl, challan
     base_url = Column(String, nullable=False)
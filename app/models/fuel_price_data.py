@@ -1,13 +1,12 @@
-from sqlalchemy import Column, String, DateTime, Date, JSON
+from sqlalchemy import Column, String, DateTime, Date, JSON, text
 from sqlalchemy.sql import func
 from app.database import Base
-import uuid
 
 
 class FuelPriceData(Base):
     __tablename__ = "fuel_price_data"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     city = Column(String, nullable=True, index=True)  # null for state-level queries
     state = Column(String, nullable=False, index=True)
     date = Column(Date, nullable=False, index=True)
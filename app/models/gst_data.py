@@ -1,13 +1,12 @@
-from sqlalchemy import Column, String, DateTime, Text, JSON
+from sqlalchemy import Column, String, DateTime, Text, JSON, text
 from sqlalchemy.sql import func
 from app.database import Base
-import uuid
 
 
 class GSTData(Base):
     __tablename__ = "gst_data"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     gstin = Column(String, unique=True, nullable=False, index=True)
     legal_name = Column(String, nullable=True, index=True)
     trade_name = Column(String, nullable=True)
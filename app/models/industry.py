@@ -1,14 +1,13 @@
-from sqlalchemy import Column, String, DateTime, Boolean
+from sqlalchemy import Column, String, DateTime, Boolean, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
-import uuid
 
 
 class Industry(Base):
     __tablename__ = "industries"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     name = Column(String, nullable=False, unique=True, index=True)
     slug = Column(String, unique=True, nullable=False, index=True)
     description = Column(String, nullable=True)
@@ -18,5 +17,5 @@ class Industry(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
     # Relationships
-    service_industries = relationship("ServiceIndustry", back_populates="industry", cascade="all, delete-orphan")
+    service_industries = relationship("ServiceIndustry", back_populates="industry", cascade="all, delete-orphan", lazy="raise_on_sql")
 
@@ -1,14 +1,14 @@
-from sqlalchemy import Column, String, DateTime, Integer, Boolean, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, Integer, Boolean, ForeignKey, Text, text, false
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
-import uuid
+from app.models.types import same_as
 
 
 class LicenceData(Base):
     __tablename__ = "licence_data"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     dl_no = Column(String, unique=True, nullable=False, index=True)
     
     # Response metadata
@@ -32,9 +32,14 @@ class LicenceData(Base):
     bio_perm_add1 = Column(Text)
     bio_perm_add2 = Column(Text)
     bio_perm_add3 = Column(Text)
-    bio_temp_add1 = Column(Text)
-    bio_temp_add2 = Column(Text)
-    bio_temp_add3 = Column(Text)
+    # NULL when bio_temp_same_as_perm is set; read through bio_temp_add1..3
+    _bio_temp_add1 = Column("bio_temp_add1", Text)
+    _bio_temp_add2 = Column("bio_temp_add2", Text)
+    _bio_temp_add3 = Column("bio_temp_add3", Text)
+    bio_temp_same_as_perm = Column(Boolean, default=False, server_default=false(), nullable=False)
+    bio_temp_add1 = same_as("_bio_temp_add1", "bio_temp_same_as_perm", "bio_perm_add1")
+    bio_temp_add2 = same_as("_bio_temp_add2", "bio_temp_same_as_perm", "bio_perm_add2")
+    bio_temp_add3 = same_as("_bio_temp_add3", "bio_temp_same_as_perm", "bio_perm_add3")
     
     # Personal details
     bio_dob = Column(String)
@@ -67,13 +72,13 @@ class LicenceData(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
     
     # Relationships
-    coverages = relationship("LicenceCoverage", back_populates="licence", cascade="all, delete-orphan")
+    coverages = relationship("LicenceCoverage", back_populates="licence", cascade="all, delete-orphan", lazy="raise_on_sql")
 
 
 class LicenceCoverage(Base):
     __tablename__ = "licence_coverages"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     licence_id = Column(String, ForeignKey("licence_data.id", ondelete="CASCADE"), nullable=False)
     dl_no = Column(String, nullable=False, index=True)
     
@@ -94,5 +99,5 @@ class LicenceCoverage(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
-    licence = relationship("LicenceData", back_populates="coverages")
+    licence = relationship("LicenceData", back_populates="coverages", lazy="raise_on_sql")
 
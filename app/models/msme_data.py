@@ -1,13 +1,12 @@
-from sqlalchemy import Column, String, DateTime, JSON
+from sqlalchemy import Column, String, DateTime, JSON, text
 from sqlalchemy.sql import func
 from app.database import Base
-import uuid
 
 
 class MSMEData(Base):
     __tablename__ = "msme_data"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     udyam_number = Column(String, unique=True, nullable=False, index=True)
     enterprise_name = Column(String, nullable=True, index=True)
     organisation_type = Column(String, nullable=True)
@@ -1,13 +1,12 @@
-from sqlalchemy import Column, String, DateTime, Boolean, JSON
+from sqlalchemy import Column, String, DateTime, Boolean, JSON, text
 from sqlalchemy.sql import func
 from app.database import Base
-import uuid
 
 
 class PANData(Base):
     __tablename__ = "pan_data"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     pan_number = Column(String, unique=True, nullable=False, index=True)
     aadhaar_number = Column(String, nullable=True, index=True)  # For PAN to Aadhaar lookup
     full_name = Column(String, nullable=True, index=True)
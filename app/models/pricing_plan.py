@@ -1,13 +1,12 @@
-from sqlalchemy import Column, String, DateTime, Integer, Numeric, JSON
+from sqlalchemy import Column, String, DateTime, Integer, Numeric, JSON, text
 from sqlalchemy.sql import func
 from app.database import Base
-import uuid
 
 
 class PricingPlan(Base):
     __tablename__ = "pricing_plans"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     name = Column(String, nullable=False)
     description = Column(String)
     api_calls_limit = Column(Integer)  # null = unlimited
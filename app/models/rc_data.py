@@ -1,13 +1,13 @@
-from sqlalchemy import Column, String, DateTime, Integer, Text, JSON
+from sqlalchemy import Column, String, DateTime, Integer, Text, JSON, Boolean, text, false
 from sqlalchemy.sql import func
 from app.database import Base
-import uuid
+from app.models.types import same_as
 
 
 class RCData(Base):
     __tablename__ = "rc_data"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     reg_no = Column(String, unique=True, nullable=False, index=True)
     
     # Status fields
@@ -38,7 +38,10 @@ class RCData(Base):
     owner_name = Column(String, index=True)
     father_name = Column(String)
     permanent_address = Column(Text)
-    present_address = Column(Text)
+    # NULL when present_same_as_permanent is set; read through present_address
+    _present_address = Column("present_address", Text)
+    present_same_as_permanent = Column(Boolean, default=False, server_default=false(), nullable=False)
+    present_address = same_as("_present_address", "present_same_as_permanent", "permanent_address")
     mobile_no = Column(String)
     owner_sr_no = Column(Integer)
     
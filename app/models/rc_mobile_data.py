@@ -1,13 +1,12 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, text
 from sqlalchemy.sql import func
 from app.database import Base
-import uuid
 
 
 class RCMobileData(Base):
     __tablename__ = "rc_mobile_data"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     reg_no = Column(String, unique=True, nullable=False, index=True)
     mobile_no = Column(String, nullable=True, index=True)
     data_source = Column(String)
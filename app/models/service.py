@@ -1,14 +1,13 @@
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Numeric, JSON
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Numeric, JSON, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
-import uuid
 
 
 class Service(Base):
     __tablename__ = "services"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     name = Column(String, nullable=False, index=True)
     slug = Column(String, unique=True, nullable=False, index=True)
     category_id = Column(String, ForeignKey("categories.id", ondelete="SET NULL"), nullable=True, index=True)
@@ -22,9 +21,9 @@ class Service(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
     # Relationships
-    category = relationship("Category", back_populates="services")
-    service_industries = relationship("ServiceIndustry", back_populates="service", cascade="all, delete-orphan")
-    user_access = relationship("UserServiceAccess", back_populates="service", cascade="all, delete-orphan")
-    api_keys = relationship("ApiKey", back_populates="service")
-    usage_logs = relationship("ApiUsageLog", back_populates="service")
+    category = relationship("Category", back_populates="services", lazy="raise_on_sql")
+    service_industries = relationship("ServiceIndustry", back_populates="service", cascade="all, delete-orphan", lazy="raise_on_sql")
+    user_access = relationship("UserServiceAccess", back_populates="service", cascade="all, delete-orphan", lazy="raise_on_sql")
+    api_keys = relationship("ApiKey", back_populates="service", lazy="raise_on_sql")
+    usage_logs = relationship("ApiUsageLog", back_populates="service", lazy="raise_on_sql")
 
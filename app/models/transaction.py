@@ -1,9 +1,9 @@
-from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, Numeric
+from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
 from app.database import Base
-import uuid
+from app.models.types import Paise
 
 
 class PaymentStatus(str, enum.Enum):
@@ -15,16 +15,21 @@ class PaymentStatus(str, enum.Enum):
 class Transaction(Base):
     __tablename__ = "transactions"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    amount_paid = Column(Numeric(10, 2), nullable=False)
-    credits_purchased = Column(Numeric(10, 2), nullable=False)
+    amount_paid = Column(Paise, nullable=False)  # Stored as paise
+    credits_purchased = Column(Paise, nullable=False)  # Stored as hundredths of a credit
     payment_method = Column(String, nullable=True)
-    payment_status = Column(Enum(PaymentStatus), nullable=False, default=PaymentStatus.PENDING)
+    # Stored as a short VARCHAR guarded by a CHECK constraint (the column was created as a plain string)
+    payment_status = Column(
+        Enum(PaymentStatus, name="payment_status", native_enum=False, create_constraint=True, length=16),
+        nullable=False,
+        default=PaymentStatus.PENDING,
+    )
     transaction_id = Column(String, unique=True, nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
     # Relationships
-    user = relationship("User", back_populates="transactions")
+    user = relationship("User", back_populates="transactions", lazy="raise_on_sql")
 
@@ -0,0 +1,92 @@
+import logging
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import BigInteger, String, case, inspect
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.types import TypeDecorator
+from app.core.security import encrypt_pii, decrypt_pii
+
+logger = logging.getLogger(__name__)
+
+
+class EncryptedString(TypeDecorator):
+    """String column stored encrypted with deterministic AES-SIV
+
+    Equal plaintexts produce equal ciphertexts, so ``column == value`` filters
+    and B-tree indexes keep working on the encrypted data.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return encrypt_pii(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        decrypted = decrypt_pii(value)
+        # encrypt_pii_001 encrypted every existing row, so a failure means the
+        # key is wrong. Never hand back the ciphertext, but don't fail the whole
+        # row either: every User load (auth included) reads these columns
+        if decrypted is None:
+            logger.error("Could not decrypt PII column value; check PII_ENCRYPTION_KEY")
+        return decrypted
+
+
+class Paise(TypeDecorator):
+    """Two-decimal amount stored as a BIGINT count of hundredths (paise)
+
+    Python code keeps working with ``Decimal`` values while the database stores
+    and aggregates plain integers.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int((Decimal(str(value)) * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-2)
+
+
+def _unshare(obj, flag):
+    """Copy the source of every same_as attribute using ``flag`` into its
+    stored column, then clear the flag"""
+    for descriptor in inspect(type(obj)).all_orm_descriptors:
+        spec = getattr(getattr(descriptor, "fget", None), "same_as", None)
+        if spec is not None and spec[1] == flag:
+            stored, _, source = spec
+            setattr(obj, stored, getattr(obj, source))
+    setattr(obj, flag, False)
+
+
+def same_as(stored, flag, source):
+    """Hybrid attribute that reads ``source`` when ``flag`` is set, else ``stored``
+
+    Lets a column hold NULL instead of a copy of another column while reads
+    (in Python and in SQL) stay transparent. Writing while the flag is set
+    first materializes every attribute sharing the flag, so the new value is
+    kept and its siblings still read the same as before.
+    """
+
+    def getter(self):
+        return getattr(self, source) if getattr(self, flag) else getattr(self, stored)
+
+    getter.same_as = (stored, flag, source)
+
+    def setter(self, value):
+        if getattr(self, flag):
+            _unshare(self, flag)
+        setattr(self, stored, value)
+
+    def expression(cls):
+        return case((getattr(cls, flag), getattr(cls, source)), else_=getattr(cls, stored))
+
+    return hybrid_property(getter, setter, expr=expression)
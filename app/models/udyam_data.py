@@ -1,18 +1,20 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index, text
 from sqlalchemy.sql import func
 from app.database import Base
-import uuid
 
 
 class UdyamData(Base):
     __tablename__ = "udyam_data"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     phone_number = Column(String, nullable=False, index=True)
     udyam_number = Column(String, nullable=True, index=True)
-    enterprise_name = Column(String, nullable=True, index=True)
+    enterprise_name = Column(String, nullable=True)
     data_source = Column(String)
     fetched_at = Column(DateTime(timezone=True), server_default=func.now())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
+
+# Case-insensitive enterprise name search
+Index("ix_udyam_data_enterprise_name_lower", func.lower(UdyamData.enterprise_name))
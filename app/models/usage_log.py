@@ -1,37 +1,54 @@
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, JSON, Numeric, Boolean
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from sqlalchemy import String, DateTime, Integer, ForeignKey, JSON, Boolean, Index, text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
-import uuid
+from app.models.types import Paise
+
+if TYPE_CHECKING:
+    from app.models.api_key import ApiKey
+    from app.models.service import Service
+    from app.models.user import User
 
 
 class ApiUsageLog(Base):
     __tablename__ = "api_usage_logs"
+    __table_args__ = (
+        # Append-only, time-ordered table: a BRIN index is a fraction of the size of a B-tree
+        Index(
+            "ix_api_usage_logs_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    api_key_id = Column(String, ForeignKey("api_keys.id", ondelete="SET NULL"), nullable=True, index=True)
-    service_id = Column(String, ForeignKey("services.id", ondelete="SET NULL"), nullable=True, index=True)
+    id: Mapped[str] = mapped_column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
+    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    api_key_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("api_keys.id", ondelete="SET NULL"), index=True)
+    service_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("services.id", ondelete="SET NULL"), index=True)
     
     # Request details
-    endpoint_type = Column(String, nullable=False)  # rc, dl, challan, pan, gst, etc.
-    request_params = Column(JSON)
+    endpoint_type: Mapped[str] = mapped_column(String)  # rc, dl, challan, pan, gst, etc.
+    request_params: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
     
     # Response details
-    response_status = Column(Integer, nullable=False)
-    response_time_ms = Column(Integer, nullable=False)
-    data_source = Column(String)  # db, api1, api2, api3
-    success = Column(Boolean, default=False, nullable=False)  # True only for successful responses
+    response_status: Mapped[int] = mapped_column(Integer)
+    response_time_ms: Mapped[int] = mapped_column(Integer)
+    data_source: Mapped[Optional[str]] = mapped_column(String)  # db, api1, api2, api3
+    success: Mapped[bool] = mapped_column(Boolean, default=False)  # True only for successful responses
     
     # Credit tracking - only deducted on success
-    credits_deducted = Column(Numeric(10, 2), default=0.0, nullable=False)  # 0 for failed requests
-    credits_before = Column(Numeric(10, 2), nullable=True)
-    credits_after = Column(Numeric(10, 2), nullable=True)
+    # Stored as BIGINT hundredths of a credit
+    credits_deducted: Mapped[Decimal] = mapped_column(Paise, default=0)  # 0 for failed requests
+    credits_before: Mapped[Optional[Decimal]] = mapped_column(Paise)
+    credits_after: Mapped[Optional[Decimal]] = mapped_column(Paise)
     
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
-    user = relationship("User", back_populates="usage_logs")
-    api_key = relationship("ApiKey", back_populates="usage_logs")
-    service = relationship("Service", back_populates="usage_logs")
-
+    user: Mapped["User"] = relationship(back_populates="usage_logs", lazy="raise_on_sql")
+    api_key: Mapped[Optional["ApiKey"]] = relationship(back_populates="usage_logs", lazy="raise_on_sql")
+    service: Mapped[Optional["Service"]] = relationship(back_populates="usage_logs", lazy="raise_on_sql")
@@ -1,9 +1,9 @@
-from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, Integer, Text, Date, Numeric
+from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, Integer, Text, Date, Numeric, LargeBinary, Index, Computed, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
 from app.database import Base
-import uuid
+from app.models.types import EncryptedString
 
 
 class UserRole(str, enum.Enum):
@@ -16,16 +16,20 @@ class UserStatus(str, enum.Enum):
     INACTIVE = "inactive"
 
 
+# Cached value set for request validation (avoids rebuilding a list per call)
+USER_STATUS_VALUES = frozenset(status.value for status in UserStatus)
+
+
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    email = Column(String, unique=True, nullable=False, index=True)
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
+    email = Column(String, nullable=False)
     password_hash = Column(String, nullable=False)
     full_name = Column(String, nullable=False)
     phone = Column(String)
-    role = Column(Enum(UserRole), nullable=False, default=UserRole.CLIENT)
-    status = Column(Enum(UserStatus), nullable=False, default=UserStatus.INACTIVE)  # Users inactive by default until admin activates or payment is made
+    role = Column(Enum(UserRole, name="userrole", native_enum=True), nullable=False, default=UserRole.CLIENT)
+    status = Column(Enum(UserStatus, name="userstatus", native_enum=True), nullable=False, default=UserStatus.INACTIVE)  # Users inactive by default until admin activates or payment is made
     
     # New customer fields
     customer_name = Column(String, nullable=True)
@@ -34,14 +38,16 @@ class User(Base):
     address = Column(Text, nullable=True)
     gst_number = Column(String, nullable=True)
     msme_certificate = Column(String, nullable=True)
-    aadhar_number = Column(String, nullable=True)  # Should be encrypted in production
-    pan_number = Column(String, nullable=True)
+    aadhar_number = Column(EncryptedString, nullable=True)  # Encrypted at rest (deterministic AES-SIV)
+    pan_number = Column(EncryptedString, nullable=True)
     birthday = Column(Date, nullable=True)
     about_me = Column(Text, nullable=True)
     
     # Credit tracking
     total_credits = Column(Numeric(10, 2), default=0, nullable=False)
     credits_used = Column(Numeric(10, 2), default=0, nullable=False)
+    # Maintained by PostgreSQL (read-only); refreshed after the row is flushed
+    credits_remaining = Column(Numeric(10, 2), Computed("total_credits - credits_used", persisted=True))
     
     # Flexible pricing per user (default is global 5 rupees per credit)
     # Admin can set custom pricing per user
@@ -51,11 +57,18 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
     # Relationships
-    api_keys = relationship("ApiKey", back_populates="user", cascade="all, delete-orphan")
-    api_tokens = relationship("ApiToken", back_populates="user", cascade="all, delete-orphan")
-    usage_logs = relationship("ApiUsageLog", back_populates="user", cascade="all, delete-orphan")
-    service_access = relationship("UserServiceAccess", foreign_keys="UserServiceAccess.user_id", back_populates="user", cascade="all, delete-orphan")
-    transactions = relationship("Transaction", back_populates="user", cascade="all, delete-orphan")
+    api_keys = relationship("ApiKey", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
+    api_tokens = relationship("ApiToken", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
+    # Usage logs can be huge: let the ON DELETE CASCADE foreign key remove them instead of loading them
+    usage_logs = relationship("ApiUsageLog", back_populates="user", passive_deletes=True, lazy="raise_on_sql")
+    service_access = relationship("UserServiceAccess", foreign_keys="UserServiceAccess.user_id", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
+    transactions = relationship("Transaction", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
+
+
+# Case-insensitive email lookups: WHERE lower(email) = lower(:email)
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
+# Users that can still be served
+Index("ix_users_has_credits", User.id, postgresql_where=text("total_credits > credits_used"))
 
 
 class TokenType(str, enum.Enum):
@@ -66,14 +79,18 @@ class TokenType(str, enum.Enum):
 class ApiToken(Base):
     __tablename__ = "api_tokens"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    token_hash = Column(String, nullable=False, unique=True, index=True)
-    token_type = Column(Enum(TokenType), nullable=False)
+    token_hash = Column(LargeBinary(32), nullable=False)  # Raw SHA-256 digest
+    token_type = Column(Enum(TokenType, name="tokentype", native_enum=True), nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=False)
     revoked_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    user = relationship("User", back_populates="api_tokens")
+    user = relationship("User", back_populates="api_tokens", lazy="raise_on_sql")
+
 
+# Token hashes are unique among unrevoked tokens (nothing reads or writes
+# api_tokens yet; JWTs are stateless)
+Index("ix_api_tokens_active", ApiToken.token_hash, unique=True, postgresql_where=text("revoked_at IS NULL"))
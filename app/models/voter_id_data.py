@@ -1,16 +1,15 @@
-from sqlalchemy import Column, String, DateTime, Text, JSON
+from sqlalchemy import Column, String, DateTime, Text, JSON, Index, text
 from sqlalchemy.sql import func
 from app.database import Base
-import uuid
 
 
 class VoterIDData(Base):
     __tablename__ = "voter_id_data"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, server_default=text("gen_random_uuid()::text"))
     epic_number = Column(String, unique=True, nullable=False, index=True)
     status = Column(String, nullable=True)
-    name = Column(String, nullable=True, index=True)
+    name = Column(String, nullable=True)
     name_in_regional_lang = Column(String, nullable=True)
     age = Column(String, nullable=True)
     relation_type = Column(String, nullable=True)
@@ -37,3 +36,6 @@ class VoterIDData(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
+
+# Case-insensitive name search
+Index("ix_voter_id_data_name_lower", func.lower(VoterIDData.name))
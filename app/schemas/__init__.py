@@ -1,4 +1,5 @@
 # Pydantic schemas
+from app.schemas.envelope import ApiEnvelope
 from app.schemas.auth import UserCreate, UserLogin, UserResponse, TokenResponse, RefreshTokenRequest
 from app.schemas.marketplace import (
     IndustryCreate, IndustryResponse,
@@ -16,6 +17,7 @@ from app.schemas.voter_id import VoterIDResponse, VoterIDData
 from app.schemas.address_verification import AddressVerificationResponse, AddressVerificationData
 
 __all__ = [
+    "ApiEnvelope",
     "UserCreate", "UserLogin", "UserResponse", "TokenResponse", "RefreshTokenRequest",
     "IndustryCreate", "IndustryResponse",
     "CategoryCreate", "CategoryResponse",
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List
 
 
@@ -13,6 +13,8 @@ class ChallanOffence(BaseModel):
 
 
 class ChallanRecord(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     regNo: str
     violatorName: str
     dlRcNo: str
@@ -0,0 +1,22 @@
+from pydantic import BaseModel, ConfigDict
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ApiEnvelope(BaseModel, Generic[T]):
+    """Shared {status, message, data} response envelope
+
+    Parameterize per payload (``ApiEnvelope[VoterIDData]``) instead of
+    redeclaring the envelope fields on every response model.
+    """
+    model_config = ConfigDict(defer_build=True, extra="ignore", frozen=True)
+
+    status: int
+    message: str
+    data: Optional[T] = None
+
+    @classmethod
+    def ok(cls, data: T, message: str = "Submitted successfully"):
+        """Wrap already-built data without validation; never use on user input"""
+        return cls.model_construct(status=200, message=message, data=data)
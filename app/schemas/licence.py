@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List
 
 
@@ -8,6 +8,8 @@ class LicenceRequest(BaseModel):
 
 
 class BioObj(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     bioBioId: str
     bioGender: int
     bioGenderDesc: str
@@ -41,6 +43,8 @@ class BioObj(BaseModel):
 
 
 class BioImgObj(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     biBioId: str
     biusid: int
     biApplno: int
@@ -56,6 +60,8 @@ class BioImgObj(BaseModel):
 
 
 class DLObj(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     dlLicno: str
     bioid: str
     olacode: str
@@ -87,6 +93,8 @@ class DLObj(BaseModel):
 
 
 class DLCoverage(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     dcLicno: str
     dcCovcd: int
     endouserid: int
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from decimal import Decimal
@@ -22,8 +22,7 @@ class IndustryResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Category Schemas
@@ -44,8 +43,7 @@ class CategoryResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Service Schemas
@@ -77,8 +75,7 @@ class ServiceResponse(BaseModel):
     category: Optional[CategoryResponse] = None
     industries: Optional[List[IndustryResponse]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Subscription Schemas
@@ -101,8 +98,7 @@ class SubscriptionResponse(BaseModel):
     updated_at: datetime
     service: Optional[ServiceResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Transaction Schemas
@@ -123,8 +119,7 @@ class TransactionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Credit Purchase Schema
@@ -169,6 +164,5 @@ class APIKeyResponse(BaseModel):
     service: Optional[ServiceResponse] = None
     services: Optional[List[ServiceResponse]] = None  # Multiple services
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
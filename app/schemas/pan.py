@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -31,6 +31,8 @@ class PANDINInfo(BaseModel):
 
 
 class PANResult(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     pan_number: str
     full_name: Optional[str] = None
     full_name_split: Optional[List[str]] = None
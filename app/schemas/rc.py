@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
@@ -7,6 +7,8 @@ class RCRequest(BaseModel):
 
 
 class RCDataResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     viStatus: int
     status: str
     regNo: str
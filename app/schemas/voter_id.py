@@ -1,8 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional, List
+from app.schemas.envelope import ApiEnvelope
 
 
 class VoterIDSplitAddress(BaseModel):
+    model_config = ConfigDict(defer_build=True, extra="ignore", frozen=True)
+
     district: Optional[List[str]] = None
     state: Optional[List[List[str]]] = None
     city: Optional[List[str]] = None
@@ -12,6 +15,8 @@ class VoterIDSplitAddress(BaseModel):
 
 
 class VoterIDData(BaseModel):
+    model_config = ConfigDict(defer_build=True, extra="ignore", frozen=True, str_strip_whitespace=True)
+
     epic_number: str
     status: Optional[str] = None
     name: Optional[str] = None
@@ -37,9 +42,19 @@ class VoterIDData(BaseModel):
     split_address: Optional[VoterIDSplitAddress] = None
     urn: Optional[str] = None
 
+    @classmethod
+    def from_row(cls, row) -> "VoterIDData":
+        """Build from a trusted DB row without validation; never use on user input"""
+        return cls.model_construct(**{name: getattr(row, name) for name in cls.model_fields})
+
+
+class VoterIDResponse(ApiEnvelope[VoterIDData]):
+    """Voter ID verification response"""
 
-class VoterIDResponse(BaseModel):
-    status: int
-    message: str
-    data: Optional[VoterIDData] = None
 
+# Batch lookups validate/serialize whole lists in one pydantic-core call;
+# built on first use to match the deferred models above
+VoterIDDataList = TypeAdapter(
+    List[VoterIDData],
+    config=ConfigDict(defer_build=True, experimental_defer_build_mode=("type_adapter",)),
+)
@@ -0,0 +1,153 @@
+"""
+Build app/scripts/seed.sql from the static rows in seed_data.json
+Run with: python -m app.scripts.build_seed_sql
+"""
+import sys
+from pathlib import Path
+
+# Resolve app.* through the package, not a sys.path tweak
+if not __package__:
+    sys.exit("Run with: python -m app.scripts.build_seed_sql")
+
+import orjson
+from sqlalchemy.dialects import postgresql
+
+from app.models.rc_data import RCData
+from app.models.rc_mobile_data import RCMobileData
+from app.models.licence_data import LicenceData, LicenceCoverage
+from app.models.challan_data import ChallanData, ChallanRecord, ChallanOffence
+from app.models.dl_challan_data import DLChallanData
+from app.models.pan_data import PANData
+from app.models.address_verification_data import AddressVerificationData
+from app.models.gst_data import GSTData
+from app.models.msme_data import MSMEData
+from app.models.udyam_data import UdyamData
+from app.models.voter_id_data import VoterIDData
+from app.models.fuel_price_data import FuelPriceData
+
+SEED_ROWS_PATH = Path(__file__).with_name("seed_data.json")
+SEED_SQL_PATH = Path(__file__).with_name("seed.sql")
+
+_DIALECT = postgresql.dialect()
+
+# Columns that identify an already-seeded row, per top-level table
+SEED_KEYS = {
+    RCData: ("reg_no",),
+    LicenceData: ("dl_no",),
+    ChallanData: ("vehicle_no",),
+    RCMobileData: ("reg_no",),
+    PANData: ("pan_number",),
+    GSTData: ("gstin",),
+    MSMEData: ("udyam_number",),
+    UdyamData: ("phone_number",),
+    AddressVerificationData: ("aadhaar_no",),
+    VoterIDData: ("epic_number",),
+    FuelPriceData: ("city", "state", "date"),
+    DLChallanData: ("dl_no",),
+}
+
+
+def _literal(column, value):
+    """Render a Python value as a SQL literal cast to the column's type"""
+    type_sql = column.type.compile(dialect=_DIALECT)
+    if value is None:
+        text = "NULL"
+    elif isinstance(value, bool):
+        text = "TRUE" if value else "FALSE"
+    elif isinstance(value, (int, float)):
+        text = repr(value)
+    else:
+        if isinstance(value, (dict, list)):
+            value = orjson.dumps(value).decode()
+        text = "'" + str(value).replace("'", "''") + "'"
+    return f"CAST({text} AS {type_sql})"
+
+
+def _values_list(model, rows, sql_values=None):
+    """Column names and a VALUES list for rows sharing the same keys;
+    sql_values holds raw SQL for per-run columns such as CURRENT_DATE"""
+    sql_values = sql_values or {}
+    columns = model.__table__.c
+    names = ", ".join([*sql_values, *rows[0]])
+    tuples = ",\n".join(
+        "(" + ", ".join([*sql_values.values(), *(_literal(columns[name], value) for name, value in row.items())]) + ")"
+        for row in rows
+    )
+    return names, tuples
+
+
+def _guarded_insert(model, rows, sql_values=None):
+    """One INSERT ... SELECT for all of a table's rows, skipping any whose seed
+    key already exists"""
+    names, tuples = _values_list(model, rows, sql_values)
+    conditions = " AND ".join(
+        f"existing.{name} IS NOT DISTINCT FROM v.{name}" for name in SEED_KEYS[model]
+    )
+    return (
+        f"INSERT INTO {model.__tablename__} ({names})\n"
+        f"SELECT v.* FROM (VALUES\n{tuples}\n) AS v ({names})\n"
+        f"WHERE NOT EXISTS (SELECT 1 FROM {model.__tablename__} AS existing WHERE {conditions})"
+    )
+
+
+def _child_insert(model, rows, fk_column, parent):
+    """INSERT ... SELECT of child rows referencing the id returned by a CTE"""
+    names, tuples = _values_list(model, rows)
+    return (
+        f"INSERT INTO {model.__tablename__} ({fk_column}, {names})\n"
+        f"SELECT {parent}.id, v.* FROM {parent} CROSS JOIN (VALUES\n{tuples}\n) AS v ({names})"
+    )
+
+
+def _insert_chain(parent_model, parent_row, children):
+    """Insert a guarded parent row and, only when it was inserted, each child
+    level in turn; children are (model, rows, fk_column) from the top down and
+    every level but the last holds a single row"""
+    ctes = [f"level_0 AS (\n{_guarded_insert(parent_model, [parent_row])}\nRETURNING id\n)"]
+    for depth, (model, rows, fk_column) in enumerate(children[:-1], start=1):
+        ctes.append(
+            f"level_{depth} AS (\n{_child_insert(model, rows, fk_column, f'level_{depth - 1}')}\nRETURNING id\n)"
+        )
+    model, rows, fk_column = children[-1]
+    return "WITH " + ",\n".join(ctes) + "\n" + _child_insert(model, rows, fk_column, f"level_{len(ctes) - 1}")
+
+
+def build_seed_sql(seed_rows):
+    """Render the full seed script for the static tables"""
+    statements = [_guarded_insert(RCData, seed_rows["rc_data"])]
+    statements.append(_insert_chain(
+        LicenceData,
+        seed_rows["licence_data"][0],
+        [(LicenceCoverage, seed_rows["licence_coverages"], "licence_id")],
+    ))
+    statements.append(_insert_chain(
+        ChallanData,
+        seed_rows["challan_data"][0],
+        [
+            (ChallanRecord, seed_rows["challan_records"], "challan_data_id"),
+            (ChallanOffence, seed_rows["challan_offences"], "challan_record_id"),
+        ],
+    ))
+    for model in (
+        RCMobileData,
+        PANData,
+        GSTData,
+        MSMEData,
+        UdyamData,
+        AddressVerificationData,
+        VoterIDData,
+        DLChallanData,
+    ):
+        statements.append(_guarded_insert(model, seed_rows[model.__tablename__]))
+    # Fuel prices are seeded for the day the script runs. CURRENT_DATE, like
+    # the now() server defaults on fetched_at, is fixed at transaction start,
+    # so every row of one run shares the same date and timestamp
+    statements.append(_guarded_insert(FuelPriceData, seed_rows["fuel_price_data"], {"date": "CURRENT_DATE"}))
+    header = "-- Generated by python -m app.scripts.build_seed_sql from seed_data.json; do not edit\n\n"
+    return header + ";\n\n".join(statements) + ";\n"
+
+
+if __name__ == "__main__":
+    seed_rows = orjson.loads(SEED_ROWS_PATH.read_bytes())
+    SEED_SQL_PATH.write_text(build_seed_sql(seed_rows))
+    print(f"Wrote {SEED_SQL_PATH}")
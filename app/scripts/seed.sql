@@ -0,0 +1,95 @@
+-- Generated by python -m app.scripts.build_seed_sql from seed_data.json; do not edit
+
+INSERT INTO rc_data (reg_no, vi_status, status, state, rto, rto_code, reg_date, chassis_no, engine_no, vehicle_class, vehicle_category, vehicle_color, maker, maker_modal, body_type_desc, fuel_type, fuel_norms, owner_name, father_name, permanent_address, present_address, mobile_no, owner_sr_no, fitness_upto, tax_upto, ins_company, ins_upto, policy_no, manufactured_month_year, unladen_weight, vehicle_gross_weight, no_cylinders, cubic_cap, no_of_seats, sleeper_cap, stand_cap, wheel_base, financer_details, permit_no, permit_issue_date, permit_from, permit_upto, status_on, data_source, present_same_as_permanent)
+SELECT v.* FROM (VALUES
+(CAST('TR02AC1234' AS VARCHAR), CAST(1 AS INTEGER), CAST('ACTIVE' AS VARCHAR), CAST('TR' AS VARCHAR), CAST('WEST TRIPURA JTC, Tripura' AS VARCHAR), CAST('TR-01' AS VARCHAR), CAST('2020-02-16' AS VARCHAR), CAST('CAT76XX001C6P1XXXX' AS VARCHAR), CAST('LKJD05PXX54XXXX' AS VARCHAR), CAST('Goods Carrier(MGV)' AS VARCHAR), CAST('Goods Carrier(MGV)' AS VARCHAR), CAST('BRICK_RED' AS VARCHAR), CAST('TATA MOTORS LTD' AS VARCHAR), CAST('910 LPK FGD256VGT 582B6N6' AS VARCHAR), CAST('TIPPER BODY' AS VARCHAR), CAST('DIESEL' AS VARCHAR), CAST('BHARAT STAGE VI' AS VARCHAR), CAST('AJAY KUMAR' AS VARCHAR), CAST('RAM KUMAR' AS VARCHAR), CAST('JYOTI HEIGHTS, ANDHERI West Tripura Tripura 1719XX' AS TEXT), CAST(NULL AS TEXT), CAST('9876543210' AS VARCHAR), CAST(1 AS INTEGER), CAST('2025-08-05' AS VARCHAR), CAST('20-Jan-2025' AS VARCHAR), CAST('The New India Assurance Company Limited' AS VARCHAR), CAST('2025-01-20' AS VARCHAR), CAST('5480008458560002XXXX' AS VARCHAR), CAST('12/2020' AS VARCHAR), CAST(4140 AS INTEGER), CAST(9600 AS INTEGER), CAST(4 AS INTEGER), CAST(3300 AS INTEGER), CAST(2 AS INTEGER), CAST(0 AS INTEGER), CAST(0 AS INTEGER), CAST(2775 AS INTEGER), CAST('CIFCL' AS VARCHAR), CAST('TR2024-CG-05XXB' AS VARCHAR), CAST('2024-01-25' AS VARCHAR), CAST('2024-01-25' AS VARCHAR), CAST('2024-01-25' AS VARCHAR), CAST('2024-07-30' AS VARCHAR), CAST('db' AS VARCHAR), CAST(TRUE AS BOOLEAN))
+) AS v (reg_no, vi_status, status, state, rto, rto_code, reg_date, chassis_no, engine_no, vehicle_class, vehicle_category, vehicle_color, maker, maker_modal, body_type_desc, fuel_type, fuel_norms, owner_name, father_name, permanent_address, present_address, mobile_no, owner_sr_no, fitness_upto, tax_upto, ins_company, ins_upto, policy_no, manufactured_month_year, unladen_weight, vehicle_gross_weight, no_cylinders, cubic_cap, no_of_seats, sleeper_cap, stand_cap, wheel_base, financer_details, permit_no, permit_issue_date, permit_from, permit_upto, status_on, data_source, present_same_as_permanent)
+WHERE NOT EXISTS (SELECT 1 FROM rc_data AS existing WHERE existing.reg_no IS NOT DISTINCT FROM v.reg_no);
+
+WITH level_0 AS (
+INSERT INTO licence_data (dl_no, error_cd, db_loc, bio_bio_id, bio_gender, bio_gender_desc, bio_blood_group_name, bio_citizen, bio_first_name, bio_last_name, bio_full_name, bio_nat_name, bio_dependent_relation, bio_swd_full_name, bio_perm_add1, bio_perm_add2, bio_perm_add3, bio_temp_add1, bio_temp_add2, bio_temp_add3, bio_dob, bio_endorsement_no, bio_endorse_dt, bio_photo_url, bio_signature_url, dl_status, dl_issue_dt, dl_nt_valdfr_dt, dl_nt_valdto_dt, dl_remarks, ola_code, ola_name, state_cd, rto_code, om_rto_fullname, om_office_townname, data_source, bio_temp_same_as_perm)
+SELECT v.* FROM (VALUES
+(CAST('GJ0520210012345' AS VARCHAR), CAST(1 AS INTEGER), CAST('database' AS VARCHAR), CAST('2XXXX6AXXXXXJAXXX' AS VARCHAR), CAST(1 AS INTEGER), CAST('Male' AS VARCHAR), CAST('B+' AS VARCHAR), CAST('IND' AS VARCHAR), CAST('RAJESH' AS VARCHAR), CAST('KUMAR' AS VARCHAR), CAST('RAJESH KUMAR' AS VARCHAR), CAST('RAJESH KUMAR' AS VARCHAR), CAST('F' AS VARCHAR), CAST('RAM KUMAR' AS VARCHAR), CAST('123 MAIN STREET' AS TEXT), CAST('SURAT' AS TEXT), CAST('GUJARAT 395001' AS TEXT), CAST(NULL AS TEXT), CAST(NULL AS TEXT), CAST(NULL AS TEXT), CAST('15-Nov-1996' AS VARCHAR), CAST('GJ05/AXX/000XXXX/2021' AS VARCHAR), CAST('15-Dec-2021' AS VARCHAR), CAST('https://example.com/photo.jpg' AS VARCHAR), CAST('https://example.com/signature.jpg' AS VARCHAR), CAST('Active' AS VARCHAR), CAST('17-Jul-2021' AS VARCHAR), CAST('17-Jul-2021' AS VARCHAR), CAST('16-Jul-2041' AS VARCHAR), CAST('' AS TEXT), CAST('GJ05' AS VARCHAR), CAST('RTO,SURAT' AS VARCHAR), CAST('GJ' AS VARCHAR), CAST('GJ05' AS VARCHAR), CAST('RTO,SURAT' AS VARCHAR), CAST('SURAT' AS VARCHAR), CAST('db' AS VARCHAR), CAST(TRUE AS BOOLEAN))
+) AS v (dl_no, error_cd, db_loc, bio_bio_id, bio_gender, bio_gender_desc, bio_blood_group_name, bio_citizen, bio_first_name, bio_last_name, bio_full_name, bio_nat_name, bio_dependent_relation, bio_swd_full_name, bio_perm_add1, bio_perm_add2, bio_perm_add3, bio_temp_add1, bio_temp_add2, bio_temp_add3, bio_dob, bio_endorsement_no, bio_endorse_dt, bio_photo_url, bio_signature_url, dl_status, dl_issue_dt, dl_nt_valdfr_dt, dl_nt_valdto_dt, dl_remarks, ola_code, ola_name, state_cd, rto_code, om_rto_fullname, om_office_townname, data_source, bio_temp_same_as_perm)
+WHERE NOT EXISTS (SELECT 1 FROM licence_data AS existing WHERE existing.dl_no IS NOT DISTINCT FROM v.dl_no)
+RETURNING id
+)
+INSERT INTO licence_coverages (licence_id, dl_no, cov_cd, cov_desc, cov_abbrv, cov_status, vec_catg, issue_dt, endorse_dt, ola_name)
+SELECT level_0.id, v.* FROM level_0 CROSS JOIN (VALUES
+(CAST('GJ0520210012345' AS VARCHAR), CAST(4 AS INTEGER), CAST('LIGHT MOTOR VEHICLE' AS VARCHAR), CAST('LMV' AS VARCHAR), CAST('A' AS VARCHAR), CAST('NT' AS VARCHAR), CAST('17-Jul-2021' AS VARCHAR), CAST('17-Jul-2021' AS VARCHAR), CAST('RTO,SURAT' AS VARCHAR))
+) AS v (dl_no, cov_cd, cov_desc, cov_abbrv, cov_status, vec_catg, issue_dt, endorse_dt, ola_name);
+
+WITH level_0 AS (
+INSERT INTO challan_data (vehicle_no, total_paid_count, total_pending_count, total_physical_court_count, total_virtual_court_count, data_source)
+SELECT v.* FROM (VALUES
+(CAST('UP44BD0599' AS VARCHAR), CAST(1 AS INTEGER), CAST(2 AS INTEGER), CAST(1 AS INTEGER), CAST(0 AS INTEGER), CAST('db' AS VARCHAR))
+) AS v (vehicle_no, total_paid_count, total_pending_count, total_physical_court_count, total_virtual_court_count, data_source)
+WHERE NOT EXISTS (SELECT 1 FROM challan_data AS existing WHERE existing.vehicle_no IS NOT DISTINCT FROM v.vehicle_no)
+RETURNING id
+),
+level_1 AS (
+INSERT INTO challan_records (challan_data_id, reg_no, violator_name, dl_rc_no, challan_no, challan_date, challan_amount, challan_status, challan_payment_date, transaction_id, state, date, dpt_cd, rto_cd, court_name, court_address, sent_to_court_on, designation, traffic_police, vehicle_impound, virtual_court_status, court_status, valid_contact_no, office_name, area_name, office_text, payment_eligible, status_txt, payment_gateway, physical_challan)
+SELECT level_0.id, v.* FROM level_0 CROSS JOIN (VALUES
+(CAST('UP44BD0599' AS VARCHAR), CAST('SURESH KUMAR' AS VARCHAR), CAST('UP44BD0599' AS VARCHAR), CAST('UP235845240813192709' AS VARCHAR), CAST('13-Aug-2024 19:27' AS VARCHAR), CAST(1000 AS INTEGER), CAST('Paid' AS VARCHAR), CAST('15-Aug-2024' AS VARCHAR), CAST('TXN123456789' AS VARCHAR), CAST('UP' AS VARCHAR), CAST('12-Sep-2024' AS VARCHAR), CAST(1 AS INTEGER), CAST(1191 AS INTEGER), CAST('CJM PRAYAGRAJ' AS VARCHAR), CAST('prayagraj' AS TEXT), CAST('28-Aug-2024 11:54' AS VARCHAR), CAST('SI' AS VARCHAR), CAST(1 AS INTEGER), CAST('No' AS VARCHAR), CAST(1 AS INTEGER), CAST(1 AS INTEGER), CAST(1 AS INTEGER), CAST('Prayagraj' AS VARCHAR), CAST('BAH' AS VARCHAR), CAST('Prayagraj - BAH' AS VARCHAR), CAST(2 AS INTEGER), CAST('Challan paid successfully' AS TEXT), CAST(1 AS INTEGER), CAST(0 AS INTEGER))
+) AS v (reg_no, violator_name, dl_rc_no, challan_no, challan_date, challan_amount, challan_status, challan_payment_date, transaction_id, state, date, dpt_cd, rto_cd, court_name, court_address, sent_to_court_on, designation, traffic_police, vehicle_impound, virtual_court_status, court_status, valid_contact_no, office_name, area_name, office_text, payment_eligible, status_txt, payment_gateway, physical_challan)
+RETURNING id
+)
+INSERT INTO challan_offences (challan_record_id, offence_name, mva, penalty)
+SELECT level_1.id, v.* FROM level_1 CROSS JOIN (VALUES
+(CAST('Driving Two-wheeled without helmets' AS TEXT), CAST('Section 194 D of MVA 1988 RW section 129 of CMVA' AS TEXT), CAST(1000 AS INTEGER))
+) AS v (offence_name, mva, penalty);
+
+INSERT INTO rc_mobile_data (reg_no, mobile_no, data_source)
+SELECT v.* FROM (VALUES
+(CAST('TR02AC1234' AS VARCHAR), CAST('9876543210' AS VARCHAR), CAST('db' AS VARCHAR))
+) AS v (reg_no, mobile_no, data_source)
+WHERE NOT EXISTS (SELECT 1 FROM rc_mobile_data AS existing WHERE existing.reg_no IS NOT DISTINCT FROM v.reg_no);
+
+INSERT INTO pan_data (pan_number, aadhaar_number, full_name, full_name_split, masked_aadhaar, address, email, tax, phone_number, gender, dob, aadhaar_linked, category, less_info, is_director, is_sole_proprietor, fname, din_info, data_source)
+SELECT v.* FROM (VALUES
+(CAST('ABCDE1234F' AS VARCHAR), CAST('123456789012' AS VARCHAR), CAST('RAJESH KUMAR' AS VARCHAR), CAST('["RAJESH","KUMAR"]' AS JSON), CAST('1234****9012' AS VARCHAR), CAST('{"line_1":"123 MAIN STREET","line_2":"ANDHERI","street_name":"MAIN STREET","zip":"400053","city":"MUMBAI","state":"MAHARASHTRA","country":"INDIA","full":"123 MAIN STREET, ANDHERI, MUMBAI, MAHARASHTRA 400053, INDIA"}' AS JSON), CAST('rajesh.kumar@example.com' AS VARCHAR), CAST(TRUE AS BOOLEAN), CAST('9876543210' AS VARCHAR), CAST('Male' AS VARCHAR), CAST('15-Nov-1990' AS VARCHAR), CAST(TRUE AS BOOLEAN), CAST('person' AS VARCHAR), CAST(FALSE AS BOOLEAN), CAST('{"found":"No","info":[]}' AS JSON), CAST('{"found":"No","info":[]}' AS JSON), CAST('RAJESH' AS VARCHAR), CAST('{"din":"","dinAllocationDate":"","company_list":[]}' AS JSON), CAST('db' AS VARCHAR))
+) AS v (pan_number, aadhaar_number, full_name, full_name_split, masked_aadhaar, address, email, tax, phone_number, gender, dob, aadhaar_linked, category, less_info, is_director, is_sole_proprietor, fname, din_info, data_source)
+WHERE NOT EXISTS (SELECT 1 FROM pan_data AS existing WHERE existing.pan_number IS NOT DISTINCT FROM v.pan_number);
+
+INSERT INTO gst_data (gstin, legal_name, trade_name, business_constitution, aggregate_turn_over, authorized_signatory, business_details, business_nature, can_flag, central_jurisdiction, compliance_rating, current_registration_status, filing_status, is_field_visit_conducted, mandate_e_invoice, other_business_address, primary_business_address, register_cancellation_date, register_date, state_jurisdiction, tax_payer_type, gross_total_income, gross_total_income_financial_year, data_source)
+SELECT v.* FROM (VALUES
+(CAST('27ABCDE1234F1Z5' AS VARCHAR), CAST('ABC ENTERPRISES PRIVATE LIMITED' AS VARCHAR), CAST('ABC ENTERPRISES' AS VARCHAR), CAST('Private Limited Company' AS VARCHAR), CAST('50000000' AS VARCHAR), CAST('["RAJESH KUMAR","PRIYA SHARMA"]' AS JSON), CAST('{"bzsdtls":[{"saccd":"1234","sdes":"Manufacturing"}]}' AS JSON), CAST('["Manufacturing","Trading"]' AS JSON), CAST('N' AS VARCHAR), CAST('MUMBAI' AS TEXT), CAST('5' AS VARCHAR), CAST('Active' AS VARCHAR), CAST('[{"period":"2024-01","status":"Filed"},{"period":"2024-02","status":"Filed"}]' AS JSON), CAST('No' AS VARCHAR), CAST('No' AS VARCHAR), CAST('{}' AS JSON), CAST('{"business_nature":"Manufacturing","detailed_address":"123 INDUSTRIAL AREA, MUMBAI","registered_address":"123 INDUSTRIAL AREA, MUMBAI, MAHARASHTRA 400053","last_updated_date":"2024-01-15"}' AS JSON), CAST(NULL AS VARCHAR), CAST('2020-01-15' AS VARCHAR), CAST('MUMBAI' AS TEXT), CAST('Regular' AS VARCHAR), CAST('50000000' AS VARCHAR), CAST('2023-24' AS VARCHAR), CAST('db' AS VARCHAR))
+) AS v (gstin, legal_name, trade_name, business_constitution, aggregate_turn_over, authorized_signatory, business_details, business_nature, can_flag, central_jurisdiction, compliance_rating, current_registration_status, filing_status, is_field_visit_conducted, mandate_e_invoice, other_business_address, primary_business_address, register_cancellation_date, register_date, state_jurisdiction, tax_payer_type, gross_total_income, gross_total_income_financial_year, data_source)
+WHERE NOT EXISTS (SELECT 1 FROM gst_data AS existing WHERE existing.gstin IS NOT DISTINCT FROM v.gstin);
+
+INSERT INTO msme_data (udyam_number, enterprise_name, organisation_type, service_type, gender, social_category, date_of_incorporation, date_of_commencement, address, mobile, email, plant_details, enterprise_type, nic_code, dic, msme_dfo, date_of_udyam_registeration, data_source)
+SELECT v.* FROM (VALUES
+(CAST('UDYAM-MH-01-0001234' AS VARCHAR), CAST('ABC ENTERPRISES' AS VARCHAR), CAST('Proprietorship' AS VARCHAR), CAST('Manufacturing' AS VARCHAR), CAST('Male' AS VARCHAR), CAST('General' AS VARCHAR), CAST('2020-01-15' AS VARCHAR), CAST('2020-02-01' AS VARCHAR), CAST('{"flat_no":"123","building":"INDUSTRIAL COMPLEX","village":"","block":"","street":"INDUSTRIAL AREA","district":"MUMBAI","city":"MUMBAI","state":"MAHARASHTRA","pin":"400053"}' AS JSON), CAST('9876543210' AS VARCHAR), CAST('abc@enterprises.com' AS VARCHAR), CAST('[]' AS JSON), CAST('[{"classification_year":"2024","enterprise_type":"Medium Enterprise","classification_date":"2024-01-01"}]' AS JSON), CAST('[{"nic_2_digit":"25","nic_4_digit":"2511","nic_5_digit":"25111","activity":"Manufacturing of motor vehicles","date":"2024-01-01"}]' AS JSON), CAST('MUMBAI' AS VARCHAR), CAST('MUMBAI' AS VARCHAR), CAST('2020-01-15' AS VARCHAR), CAST('db' AS VARCHAR))
+) AS v (udyam_number, enterprise_name, organisation_type, service_type, gender, social_category, date_of_incorporation, date_of_commencement, address, mobile, email, plant_details, enterprise_type, nic_code, dic, msme_dfo, date_of_udyam_registeration, data_source)
+WHERE NOT EXISTS (SELECT 1 FROM msme_data AS existing WHERE existing.udyam_number IS NOT DISTINCT FROM v.udyam_number);
+
+INSERT INTO udyam_data (phone_number, udyam_number, enterprise_name, data_source)
+SELECT v.* FROM (VALUES
+(CAST('9876543210' AS VARCHAR), CAST('UDYAM-MH-01-0001234' AS VARCHAR), CAST('ABC ENTERPRISES' AS VARCHAR), CAST('db' AS VARCHAR))
+) AS v (phone_number, udyam_number, enterprise_name, data_source)
+WHERE NOT EXISTS (SELECT 1 FROM udyam_data AS existing WHERE existing.phone_number IS NOT DISTINCT FROM v.phone_number);
+
+INSERT INTO address_verification_data (aadhaar_no, dob, category, full_name, first_name, middle_name, last_name, response_type, data_source)
+SELECT v.* FROM (VALUES
+(CAST('123456789012' AS VARCHAR), CAST('15-Nov-1990' AS VARCHAR), CAST('General' AS VARCHAR), CAST('RAJESH KUMAR' AS VARCHAR), CAST('RAJESH' AS VARCHAR), CAST('' AS VARCHAR), CAST('KUMAR' AS VARCHAR), CAST(1 AS INTEGER), CAST('db' AS VARCHAR))
+) AS v (aadhaar_no, dob, category, full_name, first_name, middle_name, last_name, response_type, data_source)
+WHERE NOT EXISTS (SELECT 1 FROM address_verification_data AS existing WHERE existing.aadhaar_no IS NOT DISTINCT FROM v.aadhaar_no);
+
+INSERT INTO voter_id_data (epic_number, status, name, name_in_regional_lang, age, relation_type, relation_name, relation_name_in_regional_lang, father_name, dob, gender, state, assembly_constituency_number, assembly_constituency, parliamentary_constituency_number, parliamentary_constituency, part_number, part_name, serial_number, polling_station, address, photo, split_address, urn, data_source)
+SELECT v.* FROM (VALUES
+(CAST('ABC1234567' AS VARCHAR), CAST('Active' AS VARCHAR), CAST('RAJESH KUMAR' AS VARCHAR), CAST('राजेश कुमार' AS VARCHAR), CAST('34' AS VARCHAR), CAST('Son of' AS VARCHAR), CAST('RAM KUMAR' AS VARCHAR), CAST('राम कुमार' AS VARCHAR), CAST('RAM KUMAR' AS VARCHAR), CAST('15-Nov-1990' AS VARCHAR), CAST('Male' AS VARCHAR), CAST('MAHARASHTRA' AS VARCHAR), CAST('123' AS VARCHAR), CAST('ANDHERI WEST' AS VARCHAR), CAST('24' AS VARCHAR), CAST('MUMBAI NORTH' AS VARCHAR), CAST('45' AS VARCHAR), CAST('ANDHERI WEST' AS VARCHAR), CAST('1234' AS VARCHAR), CAST('PS 45, ANDHERI WEST' AS VARCHAR), CAST('123 MAIN STREET, ANDHERI WEST, MUMBAI, MAHARASHTRA 400053' AS TEXT), CAST('https://example.com/voter_photo.jpg' AS VARCHAR), CAST('{"district":"MUMBAI","state":"MAHARASHTRA","city":"MUMBAI","pincode":"400053","country":"INDIA","address_line":"123 MAIN STREET, ANDHERI WEST"}' AS JSON), CAST('123456789' AS VARCHAR), CAST('db' AS VARCHAR))
+) AS v (epic_number, status, name, name_in_regional_lang, age, relation_type, relation_name, relation_name_in_regional_lang, father_name, dob, gender, state, assembly_constituency_number, assembly_constituency, parliamentary_constituency_number, parliamentary_constituency, part_number, part_name, serial_number, polling_station, address, photo, split_address, urn, data_source)
+WHERE NOT EXISTS (SELECT 1 FROM voter_id_data AS existing WHERE existing.epic_number IS NOT DISTINCT FROM v.epic_number);
+
+INSERT INTO dl_challan_data (dl_no, reg_no, state, rto, reg_date, status, owner_name, father_name, permanent_address, present_address, mobile_no, owner_sr_no, vehicle_class, maker, maker_model, fuel_type, data_source)
+SELECT v.* FROM (VALUES
+(CAST('GJ0520210012345' AS VARCHAR), CAST('GJ05AB1234' AS VARCHAR), CAST('GUJARAT' AS VARCHAR), CAST('RTO,SURAT' AS VARCHAR), CAST('2020-01-15' AS VARCHAR), CAST('ACTIVE' AS VARCHAR), CAST('RAJESH KUMAR' AS VARCHAR), CAST('RAM KUMAR' AS VARCHAR), CAST('123 MAIN STREET, SURAT, GUJARAT 395001' AS TEXT), CAST('123 MAIN STREET, SURAT, GUJARAT 395001' AS TEXT), CAST('9876543210' AS VARCHAR), CAST(1 AS INTEGER), CAST('LMV' AS VARCHAR), CAST('MARUTI SUZUKI' AS VARCHAR), CAST('SWIFT' AS VARCHAR), CAST('PETROL' AS VARCHAR), CAST('db' AS VARCHAR))
+) AS v (dl_no, reg_no, state, rto, reg_date, status, owner_name, father_name, permanent_address, present_address, mobile_no, owner_sr_no, vehicle_class, maker, maker_model, fuel_type, data_source)
+WHERE NOT EXISTS (SELECT 1 FROM dl_challan_data AS existing WHERE existing.dl_no IS NOT DISTINCT FROM v.dl_no);
+
+INSERT INTO fuel_price_data (date, city, state, source, fuel_prices, data_source)
+SELECT v.* FROM (VALUES
+(CURRENT_DATE, CAST('MUMBAI' AS VARCHAR), CAST('MAHARASHTRA' AS VARCHAR), CAST('Indian Oil Corporation' AS VARCHAR), CAST('[{"fuel_type":"Petrol","price_per_litre":96.72,"currency":"INR","change_since_yesterday":0.0},{"fuel_type":"Diesel","price_per_litre":89.62,"currency":"INR","change_since_yesterday":0.0}]' AS JSON), CAST('db' AS VARCHAR)),
+(CURRENT_DATE, CAST(NULL AS VARCHAR), CAST('MAHARASHTRA' AS VARCHAR), CAST('Indian Oil Corporation' AS VARCHAR), CAST('[{"fuel_type":"Petrol","price_per_litre":96.72,"currency":"INR","change_since_yesterday":0.0},{"fuel_type":"Diesel","price_per_litre":89.62,"currency":"INR","change_since_yesterday":0.0}]' AS JSON), CAST('db' AS VARCHAR))
+) AS v (date, city, state, source, fuel_prices, data_source)
+WHERE NOT EXISTS (SELECT 1 FROM fuel_price_data AS existing WHERE existing.city IS NOT DISTINCT FROM v.city AND existing.state IS NOT DISTINCT FROM v.state AND existing.date IS NOT DISTINCT FROM v.date);
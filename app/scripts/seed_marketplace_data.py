@@ -4,13 +4,19 @@ Run with: python -m app.scripts.seed_marketplace_data
 """
 import asyncio
 import sys
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
-from datetime import datetime, timedelta
+from typing import Tuple
+from datetime import datetime
 from decimal import Decimal
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from sqlalchemy import insert, select, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from app.database import AsyncSessionLocal, init_db
 from app.models.industry import Industry
 from app.models.category import Category
@@ -18,6 +24,7 @@ from app.models.service import Service
 from app.models.service_industry import ServiceIndustry
 from app.models.user import User, UserRole, UserStatus
 # Subscription model removed - using user_service_access instead
+from app.models.user_service_access import UserServiceAccess
 from app.models.transaction import Transaction, PaymentStatus
 from app.models.api_key import ApiKey, ApiKeyStatus
 from app.core.security import get_password_hash, generate_api_key
@@ -33,141 +40,189 @@ from app.models.voter_id_data import VoterIDData
 from app.models.dl_challan_data import DLChallanData
 
 
+@dataclass(frozen=True, slots=True)
+class IndustrySeed:
+    name: str
+    slug: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class CategorySeed:
+    name: str
+    slug: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceSeed:
+    name: str
+    slug: str
+    category: str  # Category slug
+    endpoint: str
+    industries: Tuple[str, ...]  # Industry slugs
+
+
+INDUSTRIES: Tuple[IndustrySeed, ...] = (
+    IndustrySeed("Banking", "banking", "Banking and financial services"),
+    IndustrySeed("Insurance", "insurance", "Insurance companies and services"),
+    IndustrySeed("Automobile", "automobile", "Automobile dealers and services"),
+    IndustrySeed("Legal Industry", "legal-industry", "Legal firms and services"),
+    IndustrySeed("Fintech", "fintech", "Financial technology companies"),
+    IndustrySeed("Mobility", "mobility", "Taxi and mobility services"),
+    IndustrySeed("Logistic & Transport", "logistic-transport", "Logistics and transportation"),
+    IndustrySeed("NBFC", "nbfc", "Non-Banking Financial Companies"),
+)
+
+CATEGORIES: Tuple[CategorySeed, ...] = (
+    CategorySeed("KYC Status", "kyc-status", "Know Your Customer verification APIs"),
+    CategorySeed("Business Verification", "business-verification", "Business and company verification APIs"),
+    CategorySeed("Vehicle Screening", "vehicle-screening", "Vehicle and driving license verification APIs"),
+)
+
+SERVICES: Tuple[ServiceSeed, ...] = (
+    # Vehicle Screening
+    ServiceSeed("Vehicle RC Verification", "vehicle-rc-verification", "vehicle-screening", "/api/v1/services/vehicle-rc-verification",
+                ("banking", "insurance", "automobile", "logistic-transport", "nbfc")),
+    ServiceSeed("RC to Mobile Number", "rc-to-mobile", "vehicle-screening", "/api/v1/services/rc-to-mobile",
+                ("banking", "insurance", "fintech")),
+    ServiceSeed("RC to Engine and Chassis Number", "rc-to-engine-chassis", "vehicle-screening", "/api/v1/services/rc-to-engine-chassis",
+                ("automobile", "insurance")),
+    ServiceSeed("Basic Vehicle Info", "basic-vehicle-info", "vehicle-screening", "/api/v1/services/basic-vehicle-info",
+                ("banking", "insurance", "automobile", "logistic-transport")),
+    ServiceSeed("Driving License API", "driving-licence", "kyc-status", "/api/v1/services/driving-licence",
+                ("banking", "insurance", "mobility", "logistic-transport")),
+    ServiceSeed("DL to Challan API", "dl-to-challan", "vehicle-screening", "/api/v1/services/dl-to-challan",
+                ("insurance", "legal-industry", "logistic-transport")),
+    ServiceSeed("Challan Detail API", "challan-detail", "vehicle-screening", "/api/v1/services/challan-detail",
+                ("banking", "insurance", "legal-industry", "logistic-transport")),
+    ServiceSeed("Fuel Price by City", "fuel-price-city", "vehicle-screening", "/api/v1/services/fuel-price-city",
+                ("automobile", "logistic-transport", "fintech")),
+    ServiceSeed("Fuel Price by State", "fuel-price-state", "vehicle-screening", "/api/v1/services/fuel-price-state",
+                ("automobile", "logistic-transport", "fintech")),
+
+    # KYC Status
+    ServiceSeed("PAN Verification", "pan-verification", "kyc-status", "/api/v1/services/pan-verification",
+                ("banking", "insurance", "fintech", "nbfc")),
+    ServiceSeed("Aadhaar to PAN", "aadhaar-to-pan", "kyc-status", "/api/v1/services/aadhaar-to-pan",
+                ("banking", "insurance", "fintech")),
+    ServiceSeed("PAN to Aadhaar Verification", "pan-to-aadhaar", "kyc-status", "/api/v1/services/pan-to-aadhaar",
+                ("banking", "insurance", "fintech")),
+    ServiceSeed("Address Verification", "address-verification", "kyc-status", "/api/v1/services/address-verification",
+                ("banking", "insurance", "logistic-transport")),
+
+    # Business Verification
+    ServiceSeed("GST Verification (Advance)", "gst-verification", "business-verification", "/api/v1/services/gst-verification",
+                ("banking", "insurance", "fintech", "logistic-transport")),
+    ServiceSeed("GST Basic Details", "gst-basic-details", "business-verification", "/api/v1/services/gst-basic-details",
+                ("banking", "insurance", "fintech")),
+    ServiceSeed("GST Address", "gst-address", "business-verification", "/api/v1/services/gst-address",
+                ("banking", "insurance", "logistic-transport")),
+    ServiceSeed("GST Aadhaar Status", "gst-aadhaar-status", "business-verification", "/api/v1/services/gst-aadhaar-status",
+                ("banking", "insurance", "fintech")),
+    ServiceSeed("MSME Verification", "msme-verification", "business-verification", "/api/v1/services/msme-verification",
+                ("banking", "insurance", "logistic-transport")),
+    ServiceSeed("Udyam API", "phone-to-udyam", "business-verification", "/api/v1/services/phone-to-udyam",
+                ("banking", "insurance", "fintech")),
+    ServiceSeed("Voter ID Verification", "voter-id-verification", "kyc-status", "/api/v1/services/voter-id-verification",
+                ("banking", "insurance", "fintech", "legal-industry")),
+)
+
+
+async def _copy_rows(db, model, rows):
+    """COPY rows (dicts sharing the same keys) into model's table on the
+    session's connection and transaction. COPY skips Python-side column
+    defaults, so rows must carry those values themselves"""
+    columns = list(rows[0])
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        model.__tablename__,
+        records=[tuple(row[column] for column in columns) for row in rows],
+        columns=columns,
+    )
+
+
 async def seed_marketplace():
     """Seed marketplace data"""
     print("Seeding marketplace data...")
     
-    async with AsyncSessionLocal() as db:
+    # One transaction for the whole seed: it applies completely or not at all
+    async with AsyncSessionLocal() as db, db.begin():
+        # A lost seed is simply re-run, so don't wait for the WAL flush on commit
+        await db.execute(text("SET LOCAL synchronous_commit = OFF"))
+        
         # 1. Create Industries
         print("Creating industries...")
-        industries_data = [
-            {"name": "Banking", "slug": "banking", "description": "Banking and financial services"},
-            {"name": "Insurance", "slug": "insurance", "description": "Insurance companies and services"},
-            {"name": "Automobile", "slug": "automobile", "description": "Automobile dealers and services"},
-            {"name": "Legal Industry", "slug": "legal-industry", "description": "Legal firms and services"},
-            {"name": "Fintech", "slug": "fintech", "description": "Financial technology companies"},
-            {"name": "Mobility", "slug": "mobility", "description": "Taxi and mobility services"},
-            {"name": "Logistic & Transport", "slug": "logistic-transport", "description": "Logistics and transportation"},
-            {"name": "NBFC", "slug": "nbfc", "description": "Non-Banking Financial Companies"},
-        ]
-        
-        industries = {}
-        for ind_data in industries_data:
-            industry = Industry(**ind_data)
-            db.add(industry)
-            await db.flush()
-            industries[ind_data["slug"]] = industry
-            print(f"  Created industry: {industry.name}")
-        
-        await db.commit()
+        # Ids are generated here so child rows can reference them without a
+        # flush or RETURNING round-trip; each table is one COPY
+        industries = {industry.slug: str(uuid.uuid4()) for industry in INDUSTRIES}
+        await _copy_rows(
+            db,
+            Industry,
+            [
+                dict(id=industries[industry.slug], name=industry.name, slug=industry.slug,
+                     description=industry.description, is_active=True)
+                for industry in INDUSTRIES
+            ],
+        )
+        print(f"  Created {len(industries)} industries")
         
         # 2. Create Categories
         print("Creating categories...")
-        categories_data = [
-            {"name": "KYC Status", "slug": "kyc-status", "description": "Know Your Customer verification APIs"},
-            {"name": "Business Verification", "slug": "business-verification", "description": "Business and company verification APIs"},
-            {"name": "Vehicle Screening", "slug": "vehicle-screening", "description": "Vehicle and driving license verification APIs"},
-        ]
-        
-        categories = {}
-        for cat_data in categories_data:
-            category = Category(**cat_data)
-            db.add(category)
-            await db.flush()
-            categories[cat_data["slug"]] = category
-            print(f"  Created category: {category.name}")
-        
-        await db.commit()
+        categories = {category.slug: str(uuid.uuid4()) for category in CATEGORIES}
+        await _copy_rows(
+            db,
+            Category,
+            [
+                dict(id=categories[category.slug], name=category.name, slug=category.slug,
+                     description=category.description, is_active=True)
+                for category in CATEGORIES
+            ],
+        )
+        print(f"  Created {len(categories)} categories")
         
         # 3. Create Services
         print("Creating services...")
-        services_data = [
-            # Vehicle Screening
-            {"name": "Vehicle RC Verification", "slug": "vehicle-rc-verification", "category": "vehicle-screening", 
-             "endpoint": "/api/v1/services/vehicle-rc-verification", "industries": ["banking", "insurance", "automobile", "logistic-transport", "nbfc"]},
-            {"name": "RC to Mobile Number", "slug": "rc-to-mobile", "category": "vehicle-screening",
-             "endpoint": "/api/v1/services/rc-to-mobile", "industries": ["banking", "insurance", "fintech"]},
-            {"name": "RC to Engine and Chassis Number", "slug": "rc-to-engine-chassis", "category": "vehicle-screening",
-             "endpoint": "/api/v1/services/rc-to-engine-chassis", "industries": ["automobile", "insurance"]},
-            {"name": "Basic Vehicle Info", "slug": "basic-vehicle-info", "category": "vehicle-screening",
-             "endpoint": "/api/v1/services/basic-vehicle-info", "industries": ["banking", "insurance", "automobile", "logistic-transport"]},
-            {"name": "Driving License API", "slug": "driving-licence", "category": "kyc-status",
-             "endpoint": "/api/v1/services/driving-licence", "industries": ["banking", "insurance", "mobility", "logistic-transport"]},
-            {"name": "DL to Challan API", "slug": "dl-to-challan", "category": "vehicle-screening",
-             "endpoint": "/api/v1/services/dl-to-challan", "industries": ["insurance", "legal-industry", "logistic-transport"]},
-            {"name": "Challan Detail API", "slug": "challan-detail", "category": "vehicle-screening",
-             "endpoint": "/api/v1/services/challan-detail", "industries": ["banking", "insurance", "legal-industry", "logistic-transport"]},
-            {"name": "Fuel Price by City", "slug": "fuel-price-city", "category": "vehicle-screening",
-             "endpoint": "/api/v1/services/fuel-price-city", "industries": ["automobile", "logistic-transport", "fintech"]},
-            {"name": "Fuel Price by State", "slug": "fuel-price-state", "category": "vehicle-screening",
-             "endpoint": "/api/v1/services/fuel-price-state", "industries": ["automobile", "logistic-transport", "fintech"]},
-            
-            # KYC Status
-            {"name": "PAN Verification", "slug": "pan-verification", "category": "kyc-status",
-             "endpoint": "/api/v1/services/pan-verification", "industries": ["banking", "insurance", "fintech", "nbfc"]},
-            {"name": "Aadhaar to PAN", "slug": "aadhaar-to-pan", "category": "kyc-status",
-             "endpoint": "/api/v1/services/aadhaar-to-pan", "industries": ["banking", "insurance", "fintech"]},
-            {"name": "PAN to Aadhaar Verification", "slug": "pan-to-aadhaar", "category": "kyc-status",
-             "endpoint": "/api/v1/services/pan-to-aadhaar", "industries": ["banking", "insurance", "fintech"]},
-            {"name": "Address Verification", "slug": "address-verification", "category": "kyc-status",
-             "endpoint": "/api/v1/services/address-verification", "industries": ["banking", "insurance", "logistic-transport"]},
-            
-            # Business Verification
-            {"name": "GST Verification (Advance)", "slug": "gst-verification", "category": "business-verification",
-             "endpoint": "/api/v1/services/gst-verification", "industries": ["banking", "insurance", "fintech", "logistic-transport"]},
-            {"name": "GST Basic Details", "slug": "gst-basic-details", "category": "business-verification",
-             "endpoint": "/api/v1/services/gst-basic-details", "industries": ["banking", "insurance", "fintech"]},
-            {"name": "GST Address", "slug": "gst-address", "category": "business-verification",
-             "endpoint": "/api/v1/services/gst-address", "industries": ["banking", "insurance", "logistic-transport"]},
-            {"name": "GST Aadhaar Status", "slug": "gst-aadhaar-status", "category": "business-verification",
-             "endpoint": "/api/v1/services/gst-aadhaar-status", "industries": ["banking", "insurance", "fintech"]},
-            {"name": "MSME Verification", "slug": "msme-verification", "category": "business-verification",
-             "endpoint": "/api/v1/services/msme-verification", "industries": ["banking", "insurance", "logistic-transport"]},
-            {"name": "Udyam API", "slug": "phone-to-udyam", "category": "business-verification",
-             "endpoint": "/api/v1/services/phone-to-udyam", "industries": ["banking", "insurance", "fintech"]},
-            {"name": "Voter ID Verification", "slug": "voter-id-verification", "category": "kyc-status",
-             "endpoint": "/api/v1/services/voter-id-verification", "industries": ["banking", "insurance", "fintech", "legal-industry"]},
-        ]
-        
-        services = {}
-        for svc_data in services_data:
-            service = Service(
-                name=svc_data["name"],
-                slug=svc_data["slug"],
-                category_id=categories[svc_data["category"]].id,
-                description=f"{svc_data['name']} API service",
-                endpoint_path=svc_data["endpoint"],
+        services = {
+            svc.slug: dict(
+                id=str(uuid.uuid4()),
+                name=svc.name,
+                slug=svc.slug,
+                category_id=categories[svc.category],
+                description=f"{svc.name} API service",
+                endpoint_path=svc.endpoint,
                 price_per_call=Decimal("1.0"),
                 is_active=True
             )
-            db.add(service)
-            await db.flush()
-            services[svc_data["slug"]] = service
-            
-            # Link to industries
-            for ind_slug in svc_data["industries"]:
-                service_industry = ServiceIndustry(
-                    service_id=service.id,
-                    industry_id=industries[ind_slug].id
-                )
-                db.add(service_industry)
-            
-            print(f"  Created service: {service.name}")
+            for svc in SERVICES
+        }
+        await _copy_rows(db, Service, list(services.values()))
         
-        await db.commit()
+        # Link to industries
+        await _copy_rows(
+            db,
+            ServiceIndustry,
+            [
+                dict(service_id=services[svc.slug]["id"], industry_id=industries[ind_slug])
+                for svc in SERVICES
+                for ind_slug in svc.industries
+            ],
+        )
+        print(f"  Created {len(services)} services")
         
         # 4. Create test users with subscriptions
         print("Creating test users with subscriptions...")
         
-        # Get or create test client user
-        from sqlalchemy import select
-        result = await db.execute(select(User).where(User.email == "client@example.com"))
-        client_user = result.scalar_one_or_none()
+        # Get or create test client user; bcrypt only runs when it is missing
+        client_user_query = select(User.id).where(func.lower(User.email) == "client@example.com")
+        client_user_id = await db.scalar(client_user_query)
         
-        if not client_user:
-            client_user = User(
+        if client_user_id is None:
+            password_hash = await asyncio.to_thread(get_password_hash, "client123")
+            client_user_id = await db.scalar(pg_insert(User).values(
                 email="client@example.com",
-                password_hash=get_password_hash("client123"),
+                password_hash=password_hash,
                 full_name="Test Client",
                 phone="+91 9876543211",
                 customer_name="Test Client Company",
@@ -179,13 +234,14 @@ async def seed_marketplace():
                 status=UserStatus.ACTIVE,
                 total_credits=Decimal("400"),  # ₹2000 = 400 credits
                 credits_used=Decimal("0")
-            )
-            db.add(client_user)
-            await db.flush()
+            ).on_conflict_do_nothing().returning(User.id))
+            if client_user_id is None:
+                # Created by a concurrent run between the two statements
+                client_user_id = await db.scalar(client_user_query)
         
         # Create transaction for credit purchase
         transaction = Transaction(
-            user_id=client_user.id,
+            user_id=client_user_id,
             amount_paid=Decimal("2000"),
             credits_purchased=Decimal("400"),
             payment_method="test",
@@ -193,42 +249,33 @@ async def seed_marketplace():
             transaction_id=f"TXN-{datetime.now().strftime('%Y%m%d%H%M%S')}"
         )
         db.add(transaction)
-        await db.commit()
         
-        # Create subscriptions for some services
-        print("Creating test subscriptions...")
+        # Grant access to some services, each with its own API key. Nothing
+        # references these rows, so both tables go in as single inserts
+        print("Creating test service access and API keys...")
         test_services = ["vehicle-rc-verification", "pan-verification", "gst-verification"]
         
+        access_rows = []
+        api_key_rows = []
         for svc_slug in test_services:
             service = services[svc_slug]
-            subscription = Subscription(
-                user_id=client_user.id,
-                service_id=service.id,
-                status=SubscriptionStatus.ACTIVE,
-                credits_allocated=Decimal("100"),
-                credits_remaining=Decimal("100"),
-                started_at=datetime.utcnow(),
-                expires_at=datetime.utcnow() + timedelta(days=30)
-            )
-            db.add(subscription)
-            await db.flush()
+            access_rows.append(dict(user_id=client_user_id, service_id=service["id"]))
             
-            # Generate API key for this subscription
+            # Generate API key for this service
             full_key, key_hash, key_prefix = generate_api_key("sk_live")
-            api_key = ApiKey(
-                user_id=client_user.id,
-                service_id=service.id,
-                subscription_id=subscription.id,
+            api_key_rows.append(dict(
+                user_id=client_user_id,
+                service_id=service["id"],
                 key_hash=key_hash,
                 key_prefix=key_prefix,
-                name=f"{service.name} API Key",
+                name=f"{service['name']} API Key",
                 status=ApiKeyStatus.ACTIVE
-            )
-            db.add(api_key)
-            print(f"  Created subscription and API key for: {service.name}")
+            ))
+            print(f"  Granted access and created API key for: {service['name']}")
             print(f"    API Key: {full_key}")
         
-        await db.commit()
+        await db.execute(insert(UserServiceAccess), access_rows)
+        await db.execute(insert(ApiKey), api_key_rows)
         
         # 5. Create sample data for each service type
         print("Creating sample data...")
@@ -487,16 +534,15 @@ async def seed_marketplace():
             data_source="db"
         )
         db.add(dl_challan)
-        
-        await db.commit()
-        
-        print("\n✅ Marketplace data seeded successfully!")
-        print(f"\nCreated:")
-        print(f"  - {len(industries)} Industries")
-        print(f"  - {len(categories)} Categories")
-        print(f"  - {len(services)} Services")
-        print(f"  - Test subscriptions and API keys")
-        print(f"  - Sample data for all service types")
+    
+    # Reported only once the transaction has committed
+    print("\n✅ Marketplace data seeded successfully!")
+    print(f"\nCreated:")
+    print(f"  - {len(industries)} Industries")
+    print(f"  - {len(categories)} Categories")
+    print(f"  - {len(services)} Services")
+    print(f"  - Test subscriptions and API keys")
+    print(f"  - Sample data for all service types")
 
 
 if __name__ == "__main__":
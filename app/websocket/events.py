@@ -1,8 +1,91 @@
 """
 WebSocket event definitions and helpers
 """
-from typing import Dict, Any
-from datetime import datetime
+import enum
+import time
+from dataclasses import dataclass
+from typing import Any, Tuple
+from datetime import datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1)
+# (millisecond, formatted timestamp) of the last call
+_last_iso = (-1, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as a naive ISO string; events in the same millisecond
+    share one formatted string"""
+    global _last_iso
+    ms = time.time_ns() // 1_000_000
+    if ms != _last_iso[0]:
+        _last_iso = (ms, (_EPOCH + timedelta(milliseconds=ms)).isoformat(timespec="microseconds"))
+    return _last_iso[1]
+
+
+class EventType(str, enum.Enum):
+    """Event kinds; members are shared singletons for routing and orjson
+    writes their string value on the wire"""
+    API_CALL = "api_call"
+    CREDIT_PURCHASE = "credit_purchase"
+    SUBSCRIPTION = "subscription"
+    USER_REGISTRATION = "user_registration"
+    CREDIT_BALANCE_UPDATE = "credit_balance_update"
+
+
+@dataclass(slots=True)
+class Event:
+    """WebSocket event envelope; orjson serializes it (and its data) directly"""
+    type: EventType
+    timestamp: str
+    data: Any
+
+
+@dataclass(slots=True)
+class ApiCallData:
+    user_id: str
+    service_id: str
+    service_name: str
+    api_key_id: str
+    credits_deducted: float
+    credits_before: float
+    credits_after: float
+    response_status: int
+    response_time_ms: int
+
+
+@dataclass(slots=True)
+class CreditPurchaseData:
+    user_id: str
+    transaction_id: str
+    amount_paid: float
+    credits_purchased: float
+    new_balance: float
+
+
+@dataclass(slots=True)
+class SubscriptionData:
+    user_id: str
+    service_id: str
+    service_name: str
+    subscription_id: str
+    status: str
+    credits_allocated: float
+
+
+@dataclass(slots=True)
+class UserRegistrationData:
+    user_id: str
+    email: str
+    full_name: str
+    role: str
+
+
+@dataclass(slots=True)
+class CreditBalanceUpdateData:
+    user_id: str
+    total_credits: float
+    credits_used: float
+    credits_remaining: float
 
 
 def create_api_call_event(
@@ -15,23 +98,57 @@ def create_api_call_event(
     credits_after: float,
     response_status: int,
     response_time_ms: int
-) -> Dict[str, Any]:
+) -> Event:
     """Create API call event for WebSocket broadcast"""
-    return {
-        "type": "api_call",
-        "timestamp": datetime.utcnow().isoformat(),
-        "data": {
-            "user_id": user_id,
-            "service_id": service_id,
-            "service_name": service_name,
-            "api_key_id": api_key_id,
-            "credits_deducted": credits_deducted,
-            "credits_before": credits_before,
-            "credits_after": credits_after,
-            "response_status": response_status,
-            "response_time_ms": response_time_ms
-        }
-    }
+    return Event(EventType.API_CALL, _now_iso(), ApiCallData(
+        user_id,
+        service_id,
+        service_name,
+        api_key_id,
+        credits_deducted,
+        credits_before,
+        credits_after,
+        response_status,
+        response_time_ms
+    ))
+
+
+def create_api_call_and_balance_events(
+    user_id: str,
+    service_id: str,
+    service_name: str,
+    api_key_id: str,
+    credits_deducted: float,
+    credits_before: float,
+    credits_after: float,
+    response_status: int,
+    response_time_ms: int,
+    total_credits: float,
+    credits_used: float,
+    credits_remaining: float
+) -> Tuple[Event, Event]:
+    """Create the API call and credit balance update events sent after every
+    API call, sharing one timestamp"""
+    timestamp = _now_iso()
+    return (
+        Event(EventType.API_CALL, timestamp, ApiCallData(
+            user_id,
+            service_id,
+            service_name,
+            api_key_id,
+            credits_deducted,
+            credits_before,
+            credits_after,
+            response_status,
+            response_time_ms
+        )),
+        Event(EventType.CREDIT_BALANCE_UPDATE, timestamp, CreditBalanceUpdateData(
+            user_id,
+            total_credits,
+            credits_used,
+            credits_remaining
+        )),
+    )
 
 
 def create_credit_purchase_event(
@@ -40,19 +157,15 @@ def create_credit_purchase_event(
     amount_paid: float,
     credits_purchased: float,
     new_balance: float
-) -> Dict[str, Any]:
+) -> Event:
     """Create credit purchase event for WebSocket broadcast"""
-    return {
-        "type": "credit_purchase",
-        "timestamp": datetime.utcnow().isoformat(),
-        "data": {
-            "user_id": user_id,
-            "transaction_id": transaction_id,
-            "amount_paid": amount_paid,
-            "credits_purchased": credits_purchased,
-            "new_balance": new_balance
-        }
-    }
+    return Event(EventType.CREDIT_PURCHASE, _now_iso(), CreditPurchaseData(
+        user_id,
+        transaction_id,
+        amount_paid,
+        credits_purchased,
+        new_balance
+    ))
 
 
 def create_subscription_event(
@@ -62,20 +175,16 @@ def create_subscription_event(
     subscription_id: str,
     status: str,
     credits_allocated: float
-) -> Dict[str, Any]:
+) -> Event:
     """Create subscription creation/update event"""
-    return {
-        "type": "subscription",
-        "timestamp": datetime.utcnow().isoformat(),
-        "data": {
-            "user_id": user_id,
-            "service_id": service_id,
-            "service_name": service_name,
-            "subscription_id": subscription_id,
-            "status": status,
-            "credits_allocated": credits_allocated
-        }
-    }
+    return Event(EventType.SUBSCRIPTION, _now_iso(), SubscriptionData(
+        user_id,
+        service_id,
+        service_name,
+        subscription_id,
+        status,
+        credits_allocated
+    ))
 
 
 def create_user_registration_event(
@@ -83,18 +192,14 @@ def create_user_registration_event(
     email: str,
     full_name: str,
     role: str
-) -> Dict[str, Any]:
+) -> Event:
     """Create new user registration event for admin"""
-    return {
-        "type": "user_registration",
-        "timestamp": datetime.utcnow().isoformat(),
-        "data": {
-            "user_id": user_id,
-            "email": email,
-            "full_name": full_name,
-            "role": role
-        }
-    }
+    return Event(EventType.USER_REGISTRATION, _now_iso(), UserRegistrationData(
+        user_id,
+        email,
+        full_name,
+        role
+    ))
 
 
 def create_credit_balance_update_event(
@@ -102,16 +207,11 @@ def create_credit_balance_update_event(
     total_credits: float,
     credits_used: float,
     credits_remaining: float
-) -> Dict[str, Any]:
+) -> Event:
     """Create credit balance update event"""
-    return {
-        "type": "credit_balance_update",
-        "timestamp": datetime.utcnow().isoformat(),
-        "data": {
-            "user_id": user_id,
-            "total_credits": total_credits,
-            "credits_used": credits_used,
-            "credits_remaining": credits_remaining
-        }
-    }
-
+    return Event(EventType.CREDIT_BALANCE_UPDATE, _now_iso(), CreditBalanceUpdateData(
+        user_id,
+        total_credits,
+        credits_used,
+        credits_remaining
+    ))
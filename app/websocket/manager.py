@@ -1,22 +1,44 @@
 """
 WebSocket connection manager for real-time updates
 """
-from typing import Dict, Set, List
+import asyncio
+from collections import defaultdict
+from itertools import chain
+from typing import Any, DefaultDict, Dict, Iterable, Set, List, Optional
 from fastapi import WebSocket, WebSocketDisconnect
-import json
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Frames buffered per socket; when a client falls this far behind its
+# oldest pending frame is dropped
+SEND_QUEUE_SIZE = 256
+
+# Credit balance updates for a user are coalesced over this window (seconds);
+# only the latest one is sent
+BALANCE_FLUSH_INTERVAL = 0.025
+
 
 class ConnectionManager:
     """Manages WebSocket connections for users and admin"""
     
     def __init__(self):
-        # Map user_id -> Set of WebSocket connections
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # Map user_id -> Set of WebSocket connections. Index it only to add;
+        # lookups use `in`/.get() so they never create empty entries
+        self.active_connections: DefaultDict[str, Set[WebSocket]] = defaultdict(set)
+        # Reverse index WebSocket -> user_id; its keys are every user socket
+        self.socket_users: Dict[WebSocket, str] = {}
         # Admin connections
         self.admin_connections: Set[WebSocket] = set()
+        # Per-socket outbox and the task draining it, so sending never waits
+        # on a slow client
+        self.outboxes: Dict[WebSocket, asyncio.Queue] = {}
+        self._pumps: Dict[WebSocket, asyncio.Task] = {}
+        # Latest unsent credit balance update per user, and the timer task
+        # that will send them
+        self._pending_balances: Dict[str, Any] = {}
+        self._balance_flush: Optional[asyncio.Task] = None
     
     async def connect(self, websocket: WebSocket, user_id: str = None, is_admin: bool = False):
         """Accept and store a WebSocket connection"""
@@ -24,63 +46,106 @@ class ConnectionManager:
         
         if is_admin:
             self.admin_connections.add(websocket)
-            logger.info(f"Admin WebSocket connected. Total admin connections: {len(self.admin_connections)}")
+            self._start_pump(websocket)
+            logger.info("Admin WebSocket connected. Total admin connections: %d", len(self.admin_connections))
         elif user_id:
-            if user_id not in self.active_connections:
-                self.active_connections[user_id] = set()
-            self.active_connections[user_id].add(websocket)
-            logger.info(f"User {user_id} WebSocket connected. Total connections: {len(self.active_connections[user_id])}")
+            connections = self.active_connections[user_id]
+            connections.add(websocket)
+            self.socket_users[websocket] = user_id
+            self._start_pump(websocket)
+            logger.info("User %s WebSocket connected. Total connections: %d", user_id, len(connections))
     
     def disconnect(self, websocket: WebSocket, user_id: str = None, is_admin: bool = False):
         """Remove a WebSocket connection"""
+        self._forget(websocket)
         if is_admin:
-            self.admin_connections.discard(websocket)
-            logger.info(f"Admin WebSocket disconnected. Total admin connections: {len(self.admin_connections)}")
-        elif user_id and user_id in self.active_connections:
-            self.active_connections[user_id].discard(websocket)
-            if len(self.active_connections[user_id]) == 0:
-                del self.active_connections[user_id]
-            logger.info(f"User {user_id} WebSocket disconnected")
+            logger.info("Admin WebSocket disconnected. Total admin connections: %d", len(self.admin_connections))
+        elif user_id:
+            logger.info("User %s WebSocket disconnected", user_id)
     
-    async def send_personal_message(self, message: dict, user_id: str):
-        """Send message to specific user"""
-        if user_id in self.active_connections:
-            disconnected = set()
-            for connection in self.active_connections[user_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception as e:
-                    logger.error(f"Error sending message to user {user_id}: {e}")
-                    disconnected.add(connection)
-            
-            # Remove disconnected connections
-            for conn in disconnected:
-                self.active_connections[user_id].discard(conn)
+    def _start_pump(self, websocket: WebSocket):
+        queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self.outboxes[websocket] = queue
+        self._pumps[websocket] = asyncio.create_task(self._pump(websocket, queue))
     
-    async def broadcast_to_admin(self, message: dict):
-        """Broadcast message to all admin connections"""
-        disconnected = set()
-        for connection in self.admin_connections:
+    async def _pump(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Send queued frames to one socket; a failed send drops the socket"""
+        while True:
+            text = await queue.get()
             try:
-                await connection.send_json(message)
+                await websocket.send_text(text)
             except Exception as e:
-                logger.error(f"Error broadcasting to admin: {e}")
-                disconnected.add(connection)
-        
-        # Remove disconnected connections
-        for conn in disconnected:
-            self.admin_connections.discard(conn)
+                user_id = self.socket_users.get(websocket)
+                if user_id is not None:
+                    logger.error("Error sending message to user %s: %s", user_id, e)
+                else:
+                    logger.error("Error broadcasting to admin: %s", e)
+                # This task is ending by itself; do not let _forget cancel it
+                self._pumps.pop(websocket, None)
+                self._forget(websocket)
+                return
     
-    async def broadcast_to_all(self, message: dict):
-        """Broadcast message to all connected users and admin"""
-        # Broadcast to all users
-        for user_id in list(self.active_connections.keys()):
+    def _forget(self, websocket: WebSocket):
+        """Remove a socket from every index and stop its pump"""
+        self.admin_connections.discard(websocket)
+        user_id = self.socket_users.pop(websocket, None)
+        if user_id is not None:
+            connections = self.active_connections.get(user_id)
+            if connections is not None:
+                connections.discard(websocket)
+                if not connections:
+                    del self.active_connections[user_id]
+        self.outboxes.pop(websocket, None)
+        pump = self._pumps.pop(websocket, None)
+        if pump is not None:
+            pump.cancel()
+    
+    def _enqueue(self, connections: Iterable[WebSocket], text: str):
+        """Queue text for each connection, dropping its oldest frame when full"""
+        for connection in connections:
+            queue = self.outboxes.get(connection)
+            if queue is None:
+                continue
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(text)
+    
+    async def send_personal_message(self, message: Any, user_id: str, text: Optional[str] = None):
+        """Send message to specific user; text is the message already encoded as JSON"""
+        connections = self.active_connections.get(user_id)
+        if connections:
+            if text is None:
+                text = orjson.dumps(message).decode()
+            self._enqueue(connections, text)
+    
+    async def send_balance_update(self, message: Any, user_id: str):
+        """Send a credit balance update to a user, coalescing bursts so only
+        the newest balance within BALANCE_FLUSH_INTERVAL goes out"""
+        if user_id not in self.active_connections:
+            return
+        self._pending_balances[user_id] = message
+        if self._balance_flush is None:
+            self._balance_flush = asyncio.create_task(self._flush_balances())
+    
+    async def _flush_balances(self):
+        await asyncio.sleep(BALANCE_FLUSH_INTERVAL)
+        pending, self._pending_balances = self._pending_balances, {}
+        self._balance_flush = None
+        for user_id, message in pending.items():
             await self.send_personal_message(message, user_id)
-        
-        # Broadcast to admin
-        await self.broadcast_to_admin(message)
+    
+    async def broadcast_to_admin(self, message: Any, text: Optional[str] = None):
+        """Broadcast message to all admin connections; text is the message already encoded as JSON"""
+        if text is None:
+            text = orjson.dumps(message).decode()
+        self._enqueue(self.admin_connections, text)
+    
+    async def broadcast_to_all(self, message: Any):
+        """Broadcast message to all connected users and admin"""
+        # Encode once and queue the same frame for every socket
+        text = orjson.dumps(message).decode()
+        self._enqueue(chain(self.socket_users, self.admin_connections), text)
 
 
 # Global connection manager instance
 manager = ConnectionManager()
-
@@ -3,100 +3,167 @@ Script to check API key access and permissions
 """
 import asyncio
 import sys
+from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.database import get_db
+from sqlalchemy import select, bindparam
+from sqlalchemy.orm import joinedload, load_only, raiseload
+from app.database import AsyncSessionLocal, engine
 from app.models.api_key import ApiKey
 from app.models.user import User
 from app.models.service import Service
 from app.core.security import hash_api_key, decrypt_api_key
 
-async def check_api_key(api_key_str: str):
-    """Check API key details and access"""
-    async for db in get_db():
+# Statements are built once; each call only binds its parameters
+_API_KEYS_QUERY = (
+    select(ApiKey)
+    # Fetch only the columns printed below; anything else touched must be
+    # loaded explicitly
+    .options(
+        load_only(
+            ApiKey.id,
+            ApiKey.key_hash,
+            ApiKey.name,
+            ApiKey.key_prefix,
+            ApiKey.status,
+            ApiKey.user_id,
+            ApiKey.allowed_services,
+            ApiKey.service_id,
+            ApiKey.whitelist_urls,
+            raiseload=True,
+        ),
+        joinedload(ApiKey.user).load_only(User.email, User.full_name, raiseload=True),
+        raiseload("*"),
+    )
+    .where(ApiKey.key_hash.in_(bindparam("key_hashes", expanding=True)))
+)
+
+_SERVICE_QUERY = (
+    select(Service)
+    .options(
+        load_only(Service.id, Service.name, Service.slug, Service.is_active, raiseload=True),
+        raiseload("*"),
+    )
+    .where(Service.slug == bindparam("slug"))
+)
+
+
+async def _find_service(slug: str):
+    """Look up a service on its own session, so it can run alongside a query
+    on another session"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(_SERVICE_QUERY, {"slug": slug})
+        return result.scalar_one_or_none()
+
+
+# Report lines are collected here and written to stdout in one call when
+# the check ends
+_log_lines = []
+
+
+def _log(message):
+    _log_lines.append(message)
+
+
+def _report(api_key_str: str, api_key, gst_service):
+    """Log one key's details and its access to the GST service"""
+    if not api_key:
+        _log(f"❌ API Key not found: {api_key_str}")
+        return
+    
+    user = api_key.user
+    
+    _log(f"✅ API Key Found!")
+    _log(f"   Key ID: {api_key.id}")
+    _log(f"   Key Name: {api_key.name}")
+    _log(f"   Key Prefix: {api_key.key_prefix}")
+    _log(f"   Status: {api_key.status.value}")
+    _log(f"   User: {user.email if user else 'N/A'} ({user.full_name if user else 'N/A'})")
+    _log(f"   User ID: {api_key.user_id}")
+    _log(f"   Allowed Services: {api_key.allowed_services}")
+    _log(f"   Service ID: {api_key.service_id}")
+    allowed = api_key.allowed_service_set
+    _log(f"   Has All Services Access: {'*' in allowed}")
+    
+    # Check GST service access
+    if gst_service:
+        _log(f"\n📋 GST Service Details:")
+        _log(f"   Service ID: {gst_service.id}")
+        _log(f"   Service Name: {gst_service.name}")
+        _log(f"   Service Slug: {gst_service.slug}")
+        _log(f"   Is Active: {gst_service.is_active}")
+        
+        # Check access
+        has_access = False
+        if allowed:
+            if "*" in allowed:
+                has_access = True
+                _log(f"\n✅ Access: Has ALL services access (wildcard)")
+            elif gst_service.id in allowed:
+                has_access = True
+                _log(f"\n✅ Access: Has specific access to GST service")
+        elif api_key.service_id == gst_service.id:
+            has_access = True
+            _log(f"\n✅ Access: Has access via service_id match")
+        
+        if not has_access:
+            _log(f"\n❌ Access: NO ACCESS to GST service")
+            _log(f"   Allowed services: {api_key.allowed_services}")
+            _log(f"   Service ID: {api_key.service_id}")
+            _log(f"   GST Service ID: {gst_service.id}")
+    else:
+        _log(f"\n❌ GST Service not found in database")
+    
+    # Check whitelist URLs
+    if api_key.whitelist_urls:
+        _log(f"\n🔒 Whitelist URLs: {api_key.whitelist_urls}")
+    else:
+        _log(f"\n🔓 No whitelist URLs (all origins allowed)")
+
+
+async def check_api_keys(api_key_strs: List[str]):
+    """Check details and access for several API keys with one key query"""
+    async with AsyncSessionLocal() as db:
         try:
-            # Hash the API key
-            key_hash = hash_api_key(api_key_str)
-            
-            # Find the API key
-            result = await db.execute(
-                select(ApiKey).where(ApiKey.key_hash == key_hash)
-            )
-            api_key = result.scalar_one_or_none()
-            
-            if not api_key:
-                print(f"❌ API Key not found: {api_key_str}")
-                return
+            # Hash the API keys
+            key_hashes = [hash_api_key(api_key_str) for api_key_str in api_key_strs]
             
-            # Get user
-            user_result = await db.execute(
-                select(User).where(User.id == api_key.user_id)
+            # Find the API keys (their users come back in the same query) and,
+            # concurrently on a second connection, the GST service
+            result, gst_service = await asyncio.gather(
+                db.execute(_API_KEYS_QUERY, {"key_hashes": key_hashes}),
+                _find_service("gst-verification"),
             )
-            user = user_result.scalar_one_or_none()
-            
-            print(f"✅ API Key Found!")
-            print(f"   Key ID: {api_key.id}")
-            print(f"   Key Name: {api_key.name}")
-            print(f"   Key Prefix: {api_key.key_prefix}")
-            print(f"   Status: {api_key.status.value}")
-            print(f"   User: {user.email if user else 'N/A'} ({user.full_name if user else 'N/A'})")
-            print(f"   User ID: {api_key.user_id}")
-            print(f"   Allowed Services: {api_key.allowed_services}")
-            print(f"   Service ID: {api_key.service_id}")
-            print(f"   Has All Services Access: {'*' in (api_key.allowed_services or [])}")
-            
-            # Check GST service access
-            gst_result = await db.execute(
-                select(Service).where(Service.slug == "gst-verification")
-            )
-            gst_service = gst_result.scalar_one_or_none()
-            
-            if gst_service:
-                print(f"\n📋 GST Service Details:")
-                print(f"   Service ID: {gst_service.id}")
-                print(f"   Service Name: {gst_service.name}")
-                print(f"   Service Slug: {gst_service.slug}")
-                print(f"   Is Active: {gst_service.is_active}")
-                
-                # Check access
-                has_access = False
-                if api_key.allowed_services:
-                    if "*" in api_key.allowed_services:
-                        has_access = True
-                        print(f"\n✅ Access: Has ALL services access (wildcard)")
-                    elif gst_service.id in api_key.allowed_services:
-                        has_access = True
-                        print(f"\n✅ Access: Has specific access to GST service")
-                elif api_key.service_id == gst_service.id:
-                    has_access = True
-                    print(f"\n✅ Access: Has access via service_id match")
-                
-                if not has_access:
-                    print(f"\n❌ Access: NO ACCESS to GST service")
-                    print(f"   Allowed services: {api_key.allowed_services}")
-                    print(f"   Service ID: {api_key.service_id}")
-                    print(f"   GST Service ID: {gst_service.id}")
-            else:
-                print(f"\n❌ GST Service not found in database")
+            api_keys = {api_key.key_hash: api_key for api_key in result.scalars()}
             
-            # Check whitelist URLs
-            if api_key.whitelist_urls:
-                print(f"\n🔒 Whitelist URLs: {api_key.whitelist_urls}")
-            else:
-                print(f"\n🔓 No whitelist URLs (all origins allowed)")
+            for i, (api_key_str, key_hash) in enumerate(zip(api_key_strs, key_hashes)):
+                if i:
+                    _log("")
+                _report(api_key_str, api_keys.get(key_hash), gst_service)
             
         except Exception as e:
-            print(f"❌ Error: {e}")
+            _log(f"❌ Error: {e}")
             import traceback
             traceback.print_exc()
         finally:
-            await db.close()
+            sys.stdout.write("\n".join(_log_lines) + "\n")
+            _log_lines.clear()
+
+
+async def check_api_key(api_key_str: str):
+    """Check API key details and access"""
+    await check_api_keys([api_key_str])
+
+
+async def main(api_key_strs: List[str]):
+    """Check keys on the shared app engine, closing its pool before the loop ends"""
+    try:
+        await check_api_keys(api_key_strs)
+    finally:
+        await engine.dispose()
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python check_api_key.py <api_key>")
+        print("Usage: python check_api_key.py <api_key> [<api_key> ...]")
         sys.exit(1)
     
-    api_key = sys.argv[1]
-    asyncio.run(check_api_key(api_key))
-
+    asyncio.run(main(sys.argv[1:]))
@@ -0,0 +1,76 @@
+"""
+Shared test fixtures
+
+Tests that need a database run against the PostgreSQL server named by
+TEST_DATABASE_URL (its tables are dropped and recreated) and are skipped
+when it is not set.
+"""
+import asyncio
+import os
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import NullPool
+
+import app.models  # noqa: F401 - registers every mapper on Base.metadata
+from app.database import Base, convert_postgres_url_to_asyncpg
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+async def run_sync_on(url, fn):
+    """Run fn(sync_connection) in one transaction on a throwaway engine"""
+    engine = create_async_engine(url, poolclass=NullPool)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(fn)
+    finally:
+        await engine.dispose()
+
+
+async def run_in_session(url, fn):
+    """Run await fn(session) and commit, on a throwaway engine"""
+    engine = create_async_engine(url, poolclass=NullPool)
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            result = await fn(session)
+            await session.commit()
+            return result
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def database_url():
+    """asyncpg URL of a freshly created schema"""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    url = convert_postgres_url_to_asyncpg(TEST_DATABASE_URL)
+
+    def reset(conn):
+        Base.metadata.drop_all(conn)
+        Base.metadata.create_all(conn)
+
+    asyncio.run(run_sync_on(url, reset))
+    yield url
+    asyncio.run(run_sync_on(url, Base.metadata.drop_all))
+
+
+@pytest_asyncio.fixture
+async def engine(database_url):
+    engine = create_async_engine(database_url)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db(engine):
+    """Session configured like AsyncSessionLocal"""
+    async with async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )() as session:
+        yield session
@@ -0,0 +1,194 @@
+"""
+Query budgets for list and fallback read paths
+
+Relationships use lazy="raise_on_sql", so a missing eager load fails these
+tests with an error instead of reaching production as a 500; the budgets
+catch N+1 loops that issue one query per row. Handlers are called directly,
+so the counts exclude the auth dependency.
+"""
+import asyncio
+import uuid
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from app.api.v1.admin import list_transactions, get_user_api_keys
+from app.api.v1.client import list_api_keys_by_service, get_usage_history
+from app.core.fallback_engine import FallbackEngine
+from app.models.api_key import ApiKey, ApiKeyStatus
+from app.models.challan_data import ChallanData, ChallanRecord, ChallanOffence
+from app.models.licence_data import LicenceData, LicenceCoverage
+from app.models.service import Service
+from app.models.transaction import Transaction, PaymentStatus
+from app.models.usage_log import ApiUsageLog
+from app.models.user import User, UserRole, UserStatus
+from tests.conftest import run_in_session
+
+pytestmark = pytest.mark.asyncio
+
+ADMIN_ID = str(uuid.uuid4())
+CLIENT_ID = str(uuid.uuid4())
+SERVICE_IDS = [str(uuid.uuid4()) for _ in range(3)]
+DL_NO = "DL0420110149646"
+VEHICLE_NO = "MH01AB1234"
+
+
+class QueryCounter:
+    """Collects every statement an engine sends (before_cursor_execute recipe)"""
+
+    def __init__(self, engine):
+        self.engine = engine.sync_engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+def _user(user_id, email, role):
+    return User(
+        id=user_id,
+        email=email,
+        password_hash="not-a-real-hash",
+        full_name=email.split("@")[0].title(),
+        role=role,
+        status=UserStatus.ACTIVE,
+    )
+
+
+async def _seed(session):
+    session.add_all([
+        _user(ADMIN_ID, "admin@example.com", UserRole.ADMIN),
+        _user(CLIENT_ID, "client@example.com", UserRole.CLIENT),
+    ])
+    session.add_all(
+        Service(id=service_id, name=f"Service {i}", slug=f"service-{i}", endpoint_path=f"/service-{i}")
+        for i, service_id in enumerate(SERVICE_IDS)
+    )
+    await session.flush()
+
+    session.add_all([
+        # Specific services, a single legacy service, and all services
+        ApiKey(user_id=CLIENT_ID, key_hash="hash-1", key_prefix="sk_live_1", name="Specific",
+               status=ApiKeyStatus.ACTIVE, allowed_services=SERVICE_IDS[:2]),
+        ApiKey(user_id=CLIENT_ID, key_hash="hash-2", key_prefix="sk_live_2", name="Single",
+               status=ApiKeyStatus.ACTIVE, service_id=SERVICE_IDS[2]),
+        ApiKey(user_id=CLIENT_ID, key_hash="hash-3", key_prefix="sk_live_3", name="All",
+               status=ApiKeyStatus.ACTIVE, allowed_services=["*"]),
+    ])
+    session.add_all(
+        Transaction(user_id=user_id, amount_paid=Decimal("500.00"), credits_purchased=Decimal("100.00"),
+                    payment_method="admin", payment_status=PaymentStatus.COMPLETED)
+        for user_id in (CLIENT_ID, CLIENT_ID, ADMIN_ID)
+    )
+    session.add_all(
+        ApiUsageLog(user_id=CLIENT_ID, service_id=SERVICE_IDS[i % 3], endpoint_type="rc",
+                    response_status=200, response_time_ms=12, data_source="db", success=True,
+                    credits_deducted=Decimal("1.00"))
+        for i in range(6)
+    )
+
+    licence = LicenceData(id=str(uuid.uuid4()), dl_no=DL_NO, bio_full_name="Test Driver", data_source="db")
+    licence.coverages = [
+        LicenceCoverage(dl_no=DL_NO, cov_cd=cov_cd, cov_abbrv=abbrv)
+        for cov_cd, abbrv in ((3, "LMV"), (4, "MCWG"))
+    ]
+    challan = ChallanData(vehicle_no=VEHICLE_NO, total_pending_count=2, data_source="db")
+    challan.records = [
+        ChallanRecord(
+            reg_no=VEHICLE_NO,
+            challan_no=f"CH{i}",
+            challan_status="Pending",
+            offences=[ChallanOffence(offence_name=f"Offence {i}.{j}", penalty=500) for j in range(2)],
+        )
+        for i in range(2)
+    ]
+    session.add_all([licence, challan])
+
+
+@pytest.fixture(scope="module")
+def seeded(database_url):
+    asyncio.run(run_in_session(database_url, _seed))
+
+
+@pytest_asyncio.fixture
+async def admin(db, seeded):
+    return await db.get(User, ADMIN_ID)
+
+
+@pytest_asyncio.fixture
+async def client(db, seeded):
+    return await db.get(User, CLIENT_ID)
+
+
+async def test_list_transactions(engine, db, admin):
+    with QueryCounter(engine) as queries:
+        transactions = await list_transactions(current_admin=admin, db=db)
+
+    assert len(transactions) == 3
+    assert {txn["user_email"] for txn in transactions} == {"admin@example.com", "client@example.com"}
+    assert queries.count <= 2
+
+
+async def test_get_usage_history(engine, db, client):
+    with QueryCounter(engine) as queries:
+        logs = await get_usage_history(skip=0, limit=50, current_user=client, db=db)
+
+    assert len(logs) == 6
+    assert all(log["service_name"] for log in logs)
+    assert queries.count <= 2
+
+
+def _check_api_key_services(keys):
+    by_name = {key.name: key for key in keys}
+    assert {service.id for service in by_name["Specific"].services} == set(SERVICE_IDS[:2])
+    assert by_name["Single"].service.id == SERVICE_IDS[2]
+    assert by_name["All"].services is None
+
+
+async def test_list_api_keys_by_service(engine, db, client):
+    with QueryCounter(engine) as queries:
+        keys = await list_api_keys_by_service(current_user=client, db=db)
+
+    _check_api_key_services(keys)
+    assert queries.count <= 2
+
+
+async def test_get_user_api_keys(engine, db, admin):
+    with QueryCounter(engine) as queries:
+        keys = await get_user_api_keys(user_id=CLIENT_ID, current_admin=admin, db=db)
+
+    _check_api_key_services(keys)
+    assert queries.count <= 2
+
+
+async def test_licence_fallback_db_read(engine, db, seeded):
+    with QueryCounter(engine) as queries:
+        data, source = await FallbackEngine(db).fetch_licence_data(DL_NO, "1990-01-01")
+
+    assert source == "db"
+    assert data is not None
+    # Licence row plus its coverages
+    assert queries.count <= 2
+
+
+async def test_challan_fallback_db_read(engine, db, seeded):
+    with QueryCounter(engine) as queries:
+        data, source = await FallbackEngine(db).fetch_challan_data(VEHICLE_NO)
+
+    assert source == "db"
+    assert data is not None
+    # Challan row, its records, and their offences
+    assert queries.count <= 3
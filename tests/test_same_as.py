@@ -0,0 +1,36 @@
+from app.models.rc_data import RCData
+from app.models.licence_data import LicenceData
+
+
+def test_present_address_reads_permanent_when_flagged():
+    rc = RCData(permanent_address="1 Permanent Rd", present_same_as_permanent=True)
+
+    assert rc.present_address == "1 Permanent Rd"
+
+
+def test_write_to_flagged_present_address_is_kept():
+    rc = RCData(permanent_address="1 Permanent Rd", present_same_as_permanent=True)
+
+    rc.present_address = "2 Present St"
+
+    assert rc.present_address == "2 Present St"
+    assert rc.permanent_address == "1 Permanent Rd"
+    assert rc.present_same_as_permanent is False
+
+
+def test_write_to_one_flagged_licence_address_keeps_siblings():
+    licence = LicenceData(
+        bio_perm_add1="Line 1",
+        bio_perm_add2="Line 2",
+        bio_perm_add3="Line 3",
+        bio_temp_same_as_perm=True,
+    )
+
+    licence.bio_temp_add2 = "Other line 2"
+
+    assert licence.bio_temp_same_as_perm is False
+    assert (licence.bio_temp_add1, licence.bio_temp_add2, licence.bio_temp_add3) == (
+        "Line 1",
+        "Other line 2",
+        "Line 3",
+    )